@@ -4,16 +4,19 @@ Upload a PDF or paste an arxiv URL to generate an interactive epidemic simulator
 Three-tab output: Summary | Simulation | Code.
 """
 
+import hashlib
 import json
-import subprocess
-import sys
+import shutil
 import tempfile
+from itertools import cycle
 from pathlib import Path
 
 import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
+from episim.core.downsample import lttb
+
 st.set_page_config(
     page_title="EpiSim",
     page_icon="🔬",
@@ -826,7 +829,9 @@ with st.sidebar:
         uploaded = st.file_uploader("Upload PDF", type=["pdf"])
         if uploaded:
             tmp = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
-            tmp.write(uploaded.read())
+            # Uploader buffer persists across reruns — rewind before copying
+            uploaded.seek(0)
+            shutil.copyfileobj(uploaded, tmp, length=1 << 20)
             tmp.flush()
             paper_source = tmp.name
 
@@ -842,11 +847,11 @@ with st.sidebar:
 # ═══════════════════════════════════════════════════════════════════════════
 # Plotly chart theme (matches dark UI)
 # ═══════════════════════════════════════════════════════════════════════════
-CHART_COLORS = [
+CHART_COLORS = (
     "#f0b429", "#06d6a0", "#118ab2", "#ef476f",
     "#9b5de5", "#00bbf9", "#f15bb5", "#fee440",
     "#4cc9f0", "#80ed99",
-]
+)
 
 CHART_LAYOUT = dict(
     paper_bgcolor="rgba(0,0,0,0)",
@@ -881,24 +886,215 @@ CHART_LAYOUT = dict(
 )
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Simulation helpers
+# ═══════════════════════════════════════════════════════════════════════════
+@st.cache_resource(show_spinner=False, validate=lambda worker: worker.alive)
+def _solver_worker(output_dir: str):
+    """One warm simulation subprocess per output dir — respawned if it dies or times out."""
+    from episim.core.sim_worker import SimulationWorker
+    return SimulationWorker(output_dir)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _simulate(
+    output_dir: str,
+    params: tuple[tuple[str, float], ...],
+    y0: tuple[float, ...],
+    t_span: tuple[float, float],
+    compartments: tuple[str, ...],
+) -> dict[str, np.ndarray]:
+    """Run the solver for one parameter set. Hashable args only, so reruns hit the cache."""
+    r = _solver_worker(output_dir).run_simulation(dict(params), list(y0), t_span)
+    return {key: np.asarray(r[key]) for key in ("t", *compartments)}
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _simulate_sweep(
+    output_dir: str,
+    params: tuple[tuple[str, float], ...],
+    sweep_param: str,
+    sweep_values: tuple[float, ...],
+    y0: tuple[float, ...],
+    t_span: tuple[float, float],
+    compartment: str,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Run one trajectory per sweep value; returns (t, curves) with curves shaped (n_values, n_t).
+
+    Uses the solver's stacked `run_simulation_batch` when present — simulators
+    generated before it was part of the contract fall back to one run per value.
+    """
+    grid = [{**dict(params), sweep_param: v} for v in sweep_values]
+    runs = _solver_worker(output_dir).run_simulation_batch(grid, list(y0), t_span)
+    return np.asarray(runs[0]["t"]), np.stack([r[compartment] for r in runs])
+
+
+@st.cache_data(show_spinner=False)
+def _slider_specs(params_json: str) -> list[tuple[str, str, float, float, float, float]]:
+    """(name, label, min, max, value, step) per parameter, cached on the serialized parameters."""
+    return [
+        (
+            pname,
+            f"{pname} — {pspec['description']}",
+            float(pspec["slider_min"]),
+            float(pspec["slider_max"]),
+            float(pspec["value"]),
+            max(abs(pspec["value"]) * 0.01, 1e-6),
+        )
+        for pname, pspec in json.loads(params_json)["parameters"].items()
+    ]
+
+
+def _paper_key(source: str) -> str:
+    """Content hash for local PDFs (upload temp paths change every time), else the source itself."""
+    path = Path(source)
+    if not path.is_file():
+        return source
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@st.cache_data(show_spinner=False)
+def _cached_load_paper(key: str, _source: str) -> str:
+    """Parse a paper once per content key. `_source` is excluded from the cache hash."""
+    from episim.core.paper_loader import load_paper
+    return load_paper(_source)
+
+
+# Below the solvers' 1000-point default, so every chart and sweep curve is thinned
+MAX_PLOT_POINTS = 500
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _build_figure(
+    output_dir: str,
+    params: tuple[tuple[str, float], ...],
+    y0: tuple[float, ...],
+    t_span: tuple[float, float],
+    compartments: tuple[str, ...],
+) -> go.Figure:
+    """Compartment chart for one simulation — built once per parameter set, reused by reference."""
+    results = _simulate(output_dir, params, y0, t_span, compartments)
+    t = results["t"]
+
+    fig = go.Figure()
+    for comp, color in zip(compartments, cycle(CHART_COLORS)):
+        x_plot, y_plot = lttb(t, results[comp], MAX_PLOT_POINTS)
+        # float32 ndarrays are base64-encoded by Plotly — half the bytes of float64.
+        # Current solvers already return float32, so this is a no-op cast for them.
+        fig.add_trace(go.Scattergl(
+            x=x_plot.astype(np.float32, copy=False),
+            y=y_plot.astype(np.float32, copy=False),
+            mode="lines",
+            name=comp,
+            line=dict(width=2.5, color=color),
+        ))
+    fig.update_layout(**CHART_LAYOUT)
+    fig.update_layout(
+        xaxis_title="Days",
+        yaxis_title="Population",
+    )
+    return fig
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Pipeline execution
 # ═══════════════════════════════════════════════════════════════════════════
+_RUN_CACHE_DIR = Path(".episim_cache")
+
+
+def _run_cache_path(paper_text: str) -> Path:
+    return _RUN_CACHE_DIR / f"{hashlib.sha256(paper_text.encode()).hexdigest()}.json"
+
+
+def _simulator_digests(output_dir: Path) -> dict[str, str]:
+    """sha256 of the generated files a cached run depends on (missing files are skipped)."""
+    return {
+        fname: hashlib.sha256((output_dir / fname).read_bytes()).hexdigest()
+        for fname in ("model.py", "solver.py")
+        if (output_dir / fname).is_file()
+    }
+
+
+def _load_cached_run(path: Path) -> dict | None:
+    """Previous pipeline results for a paper, if its generated simulator is still on disk.
+
+    Output dirs are named after the model, so another paper can overwrite them —
+    the stored file hashes must still match or the entry counts as a miss.
+    """
+    from episim.core.model_spec import EpidemicModel, PaperSummary, StandaloneScript, ValidationReport
+
+    if not path.is_file():
+        return None
+    try:
+        data = json.loads(path.read_text())
+        files = _simulator_digests(Path(data["output_dir"]))
+        if "solver.py" not in files or files != data["files"]:
+            return None
+        return {
+            "model": EpidemicModel.model_validate(data["model"]),
+            "thinking": data["thinking"],
+            "report": ValidationReport.model_validate(data["report"]),
+            "output_dir": data["output_dir"],
+            "summary": data["summary"] and PaperSummary.model_validate(data["summary"]),
+            "standalone_script": (
+                data["standalone_script"]
+                and StandaloneScript.model_validate(data["standalone_script"])
+            ),
+        }
+    except (ValueError, KeyError):
+        return None  # corrupt or from an older schema — just rerun the pipeline
+
+
+def _save_run(path: Path, results: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        key: value.model_dump() if hasattr(value, "model_dump") else value
+        for key, value in results.items()
+    }
+    data["files"] = _simulator_digests(Path(results["output_dir"]))
+    path.write_text(json.dumps(data))
+
+
+def _store_results(results: dict) -> None:
+    """Publish pipeline results to session state and drop caches tied to the previous model."""
+    # New model, and the Debugger may have patched solver.py/model.py in place —
+    # drop stale workers, runs and figures
+    _solver_worker.clear()
+    _simulate.clear()
+    _simulate_sweep.clear()
+    _build_figure.clear()
+
+    for key, value in results.items():
+        st.session_state[key] = value
+    st.session_state.pipeline_done = True
+
+
 def run_with_progress(paper_source: str):
     """Run the full pipeline with Streamlit progress indicators."""
-    from episim.core.paper_loader import load_paper
     from episim.core.context_builder import build_context
     from episim.agents.reader import extract_model
     from episim.agents.summarizer import summarize_paper
     from episim.agents.builder import generate_simulator
     from episim.agents.validator import validate, write_report
-    from episim.agents.debugger import debug_and_fix, apply_fixes
+    from episim.agents.debugger import apply_fixes, speculative_fix
     from episim.agents.coder import generate_standalone
 
     progress = st.progress(0, text="Loading paper...")
 
     # 1. Load paper
-    paper_text = load_paper(paper_source)
+    paper_text = _cached_load_paper(_paper_key(paper_source), paper_source)
+
+    run_cache = _run_cache_path(paper_text)
+    cached = _load_cached_run(run_cache)
+    if cached is not None:
+        _store_results(cached)
+        progress.progress(100, text="Loaded previous results for this paper.")
+        return
+
     progress.progress(10, text="Building context...")
 
     # 2. Build context
@@ -963,6 +1159,9 @@ def run_with_progress(paper_source: str):
             )
 
             # Capture results
+            if agent_name == "Builder":
+                future.result()  # raises if Builder failed — critical
+                continue
             try:
                 result = future.result()
                 if agent_name == "Summarizer":
@@ -974,7 +1173,7 @@ def run_with_progress(paper_source: str):
                             standalone_script.code
                         )
             except Exception:
-                pass  # Summarizer and Coder are non-critical; Builder raises
+                pass  # Summarizer and Coder are non-critical
 
     # ── Sequential: Validator + Debugger (depends on Builder output) ────
     progress.progress(70, text="Validating against paper results...")
@@ -995,7 +1194,7 @@ def run_with_progress(paper_source: str):
                 accumulator.format_replay_html("Debugging Code", 1),
                 unsafe_allow_html=True,
             )
-            fixes = debug_and_fix(report, output_dir, model)
+            fixes = speculative_fix(report, output_dir, model)
             apply_fixes(fixes, output_dir)
 
     write_report(report, output_dir)
@@ -1003,14 +1202,20 @@ def run_with_progress(paper_source: str):
     thinking_slot.empty()
     progress.progress(100, text="Complete.")
 
+    results = {
+        "model": model,
+        "thinking": thinking_text,
+        "report": report,
+        "output_dir": str(output_dir),
+        "summary": summary,
+        "standalone_script": standalone_script,
+    }
+    # Only reuse validated runs — a failed one should be retried on the next Generate
+    if report.all_passed:
+        _save_run(run_cache, results)
+
     # Store in session state
-    st.session_state.model = model
-    st.session_state.thinking = thinking_text
-    st.session_state.report = report
-    st.session_state.output_dir = str(output_dir)
-    st.session_state.pipeline_done = True
-    st.session_state.summary = summary
-    st.session_state.standalone_script = standalone_script
+    _store_results(results)
 
 
 if generate and paper_source:
@@ -1065,13 +1270,12 @@ if st.session_state.pipeline_done:
             st.rerun()
 
         params = {}
-        for pname, pspec in model.parameters.items():
-            step = max(abs(pspec.value) * 0.01, 1e-6)
+        for pname, label, lo, hi, value, step in _slider_specs(model.model_dump_json(include={"parameters"})):
             params[pname] = st.slider(
-                f"{pname} — {pspec.description}",
-                min_value=float(pspec.slider_min),
-                max_value=float(pspec.slider_max),
-                value=float(pspec.value),
+                label,
+                min_value=lo,
+                max_value=hi,
+                value=value,
                 step=step,
                 format="%.4g",
             )
@@ -1192,62 +1396,81 @@ if st.session_state.pipeline_done:
             y0 = [model.initial_conditions[c] for c in model.compartments]
             t_span = (0, model.simulation_days)
 
-            sim_script = (
-                f"import sys, json\n"
-                f"sys.path.insert(0, '{output_dir}')\n"
-                f"from solver import run_simulation\n"
-                f"import numpy as np\n"
-                f"params = {json.dumps(params)}\n"
-                f"y0 = {json.dumps(y0)}\n"
-                f"r = run_simulation(params, y0, {t_span})\n"
-                f"out = {{'t': r['t'].tolist()}}\n"
-                f"for c in {json.dumps(model.compartments)}:\n"
-                f"    out[c] = r[c].tolist()\n"
-                f"print(json.dumps(out))\n"
-            )
-            result = subprocess.run(
-                [sys.executable, "-c", sim_script],
-                capture_output=True, text=True, timeout=30,
+            sim_args = (
+                str(output_dir),
+                tuple(sorted(params.items())),
+                tuple(y0),
+                t_span,
+                tuple(model.compartments),
             )
+            try:
+                results = _simulate(*sim_args)
+            except Exception as e:
+                results = None
+                st.error(f"Simulation error:\n```\n{e}\n```")
 
-            if result.returncode != 0:
-                st.error(f"Simulation error:\n```\n{result.stderr}\n```")
-            else:
-                results = json.loads(result.stdout)
-                t = np.array(results["t"])
-
-                fig = go.Figure()
-                for i, comp in enumerate(model.compartments):
-                    fig.add_trace(go.Scatter(
-                        x=t,
-                        y=np.array(results[comp]),
-                        mode="lines",
-                        name=comp,
-                        line=dict(width=2.5, color=CHART_COLORS[i % len(CHART_COLORS)]),
-                    ))
-                fig.update_layout(**CHART_LAYOUT)
-                fig.update_layout(
-                    xaxis_title="Days",
-                    yaxis_title="Population",
-                )
-                st.plotly_chart(fig, use_container_width=True)
+            if results is not None:
+                t = np.asarray(results["t"])
+                # (n_compartments, n_t) — one contiguous block for traces and metrics
+                Y = np.stack([results[c] for c in model.compartments])
+
+                st.plotly_chart(_build_figure(*sim_args), use_container_width=True)
 
                 # Key metrics
-                infected_comp = next(
-                    (c for c in model.compartments if c.startswith("I")),
-                    model.compartments[1],
+                infected_idx = next(
+                    (i for i, c in enumerate(model.compartments) if c.startswith("I")),
+                    1,
                 )
-                I_arr = np.array(results[infected_comp])
-                peak_idx = np.argmax(I_arr)
+                peak_idx = int(Y[infected_idx].argmax())
 
                 col1, col2, col3 = st.columns(3)
                 col1.metric("Peak Day", f"{t[peak_idx]:.1f}")
-                col2.metric("Peak Cases", f"{I_arr[peak_idx]:,.0f}")
-                if "S" in results:
-                    S_arr = np.array(results["S"])
-                    attack_rate = (1 - S_arr[-1] / model.population) * 100
+                col2.metric("Peak Cases", f"{Y[infected_idx, peak_idx]:,.0f}")
+                if "S" in model.compartments:
+                    s_idx = model.compartments.index("S")
+                    attack_rate = (1 - Y[s_idx, -1] / model.population) * 100
                     col3.metric("Attack Rate", f"{attack_rate:.1f}%")
 
+                # ── Sensitivity sweep ───────────────────────────────────
+                with st.expander("Sensitivity Sweep"):
+                    sweep_param = st.selectbox(
+                        "Sweep parameter (others held at current slider values)",
+                        [None, *model.parameters],
+                        format_func=lambda p: "—" if p is None else p,
+                    )
+                    if sweep_param is not None:
+                        pspec = model.parameters[sweep_param]
+                        sweep_values = tuple(float(v) for v in np.linspace(
+                            pspec.slider_min, pspec.slider_max, 5,
+                        ))
+                        infected_comp = model.compartments[infected_idx]
+                        t_sweep, curves = _simulate_sweep(
+                            str(output_dir),
+                            tuple(sorted(params.items())),
+                            sweep_param,
+                            sweep_values,
+                            tuple(y0),
+                            t_span,
+                            infected_comp,
+                        )
+
+                        sweep_fig = go.Figure()
+                        for value, curve, color in zip(sweep_values, curves, cycle(CHART_COLORS)):
+                            x_plot, y_plot = lttb(t_sweep, curve, MAX_PLOT_POINTS)
+                            sweep_fig.add_trace(go.Scattergl(
+                                x=x_plot.astype(np.float32, copy=False),
+                                y=y_plot.astype(np.float32, copy=False),
+                                mode="lines",
+                                name=f"{sweep_param} = {value:.4g}",
+                                line=dict(width=2, color=color),
+                            ))
+                        sweep_fig.update_layout(**CHART_LAYOUT)
+                        sweep_fig.update_layout(
+                            xaxis_title="Days",
+                            yaxis_title=infected_comp,
+                        )
+                        st.plotly_chart(sweep_fig, use_container_width=True)
+
         except Exception as e:
             st.error(f"Could not run simulation: {e}")
 
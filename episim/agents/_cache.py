@@ -0,0 +1,69 @@
+"""On-disk LLM response cache — opt-in, for development re-runs on the same paper.
+
+Set `EPISIM_LLM_CACHE_DIR` to enable. Responses are keyed by a SHA-256 of the
+full request kwargs (model, system prompt, messages, tool schema, thinking
+config), so any change to a prompt or input is a miss. Only responses that
+contain a tool_use block are stored — a malformed answer should be retried,
+not replayed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import anthropic
+from anthropic.types import Message
+
+
+def _cache_dir() -> Path | None:
+    path = os.environ.get("EPISIM_LLM_CACHE_DIR")
+    return Path(path).expanduser() if path else None
+
+
+def cache_key(api_kwargs: dict) -> str:
+    payload = json.dumps(api_kwargs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def load_cached(key: str) -> Message | None:
+    """Return the cached response for `key`, or None on a miss or when caching is off."""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    path = cache_dir / f"{key}.json"
+    if not path.is_file():
+        return None
+    try:
+        return Message.model_validate_json(path.read_text())
+    except ValueError:
+        return None  # corrupt or from an incompatible SDK version
+
+
+def store_cached(key: str, response: Message) -> None:
+    """Atomically write `response` under `key` if caching is on and it holds a tool call."""
+    cache_dir = _cache_dir()
+    if cache_dir is None or not any(b.type == "tool_use" for b in response.content):
+        return
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        f.write(response.model_dump_json())
+    os.replace(tmp, cache_dir / f"{key}.json")
+
+
+def cached_final_message(client: anthropic.Anthropic, **api_kwargs) -> Message:
+    """`client.messages.stream(**api_kwargs).get_final_message()`, served from disk when cached."""
+    key = cache_key(api_kwargs)
+    response = load_cached(key)
+    if response is not None:
+        return response
+
+    with client.messages.stream(**api_kwargs) as stream:
+        response = stream.get_final_message()
+
+    store_cached(key, response)
+    return response
@@ -0,0 +1,28 @@
+"""Shared Anthropic client — one connection pool for every agent call.
+
+`anthropic.Anthropic` wraps an httpx client with keep-alive pooling, so reusing
+a single instance lets later agents skip the TCP + TLS handshake.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import anthropic
+
+_client: anthropic.Anthropic | None = None
+_lock = threading.Lock()
+
+
+def get_client() -> anthropic.Anthropic:
+    """Return the process-wide client, creating it on first use (thread-safe)."""
+    global _client
+    with _lock:
+        if _client is None:
+            _client = anthropic.Anthropic()
+        return _client
+
+
+def cached_text(text: str) -> list[dict]:
+    """Wrap a system prompt or message body so the API caches it server-side across calls."""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
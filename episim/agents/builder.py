@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 from pathlib import Path
 
-import anthropic
-
+from episim.agents._cache import cached_final_message
+from episim.agents._client import cached_text, get_client
 from episim.core.model_spec import EpidemicModel, GeneratedFiles
 
 MODEL = os.environ.get("EPISIM_MODEL", "claude-sonnet-4-5-20250929")
@@ -19,44 +20,117 @@ You will receive an EpidemicModel JSON spec. Generate five files that together f
 ## File Contracts
 
 ### model.py
+Put the ODE arithmetic in a Numba-compiled `_rhs` and expose it through a thin `derivatives` wrapper. Follow this shape:
+
+```python
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional — fall back to plain Python
+    def njit(**kwargs):
+        return lambda f: f
+
+COMPARTMENTS = ["S", "I", "R"]
+PARAM_ORDER = ("beta", "gamma")
+
+
+@njit(cache=True, fastmath=True)
+def _rhs(t, y, beta, gamma):
+    S, I, R = y[0], y[1], y[2]
+    N = S + I + R
+    dSdt = -beta * S * I / N
+    dIdt = beta * S * I / N - gamma * I
+    dRdt = gamma * I
+    return np.array([dSdt, dIdt, dRdt])
+
+
+def derivatives(t, y, params):
+    return _rhs(t, np.asarray(y, dtype=np.float64), *[params[k] for k in PARAM_ORDER])
+```
+
 - Define `COMPARTMENTS: list[str]` matching the spec's compartments list (exact order).
-- Define `def derivatives(t, y, params) -> list[float]` implementing the ODE system.
-- The function must unpack `y` in the same order as COMPARTMENTS.
-- Access parameters via `params['name']` dict lookups.
-- Use only basic math (no imports needed inside the function).
+- Define `PARAM_ORDER` listing every parameter name, in the same order as `_rhs`'s trailing arguments.
+- `_rhs` takes every parameter as a separate float argument and indexes `y` in the same order as COMPARTMENTS.
+- Inside `_rhs` use only basic arithmetic on floats: no dicts, no Python `sum()`, no imports. Write totals as explicit additions.
+- `def derivatives(t, y, params)` must keep this exact signature and look parameters up by name from the `params` dict.
+- If the spec's `jacobian_system` is not null, also define `def jacobian(t, y, params)` from it (plain Python, returning an n×n nested list in COMPARTMENTS order). If it is null, do NOT define `jacobian`.
 
 ### solver.py
 CRITICAL: Use this EXACT template, only changing nothing. Do not deviate:
 
 ```python
 from scipy.integrate import solve_ivp
+from scipy.linalg import block_diag
 import numpy as np
 from model import COMPARTMENTS, derivatives
 
+try:
+    from model import jacobian
+except ImportError:  # spec had no analytic Jacobian — LSODA estimates it
+    jacobian = None
+
+
 def run_simulation(params, y0, t_span, num_points=1000):
-    t_eval = np.linspace(t_span[0], t_span[1], num_points)
     sol = solve_ivp(
         fun=lambda t, y: derivatives(t, y, params),
         t_span=t_span,
         y0=y0,
-        method='RK45',
-        t_eval=t_eval,
-        max_step=1.0,
-        rtol=1e-8,
+        method='LSODA',
+        rtol=1e-6,
         atol=1e-8,
+        dense_output=True,
+        jac=(lambda t, y: jacobian(t, y, params)) if jacobian else None,
     )
     if not sol.success:
         raise RuntimeError(f"ODE solver failed: {sol.message}")
-    results = {"t": sol.t}
+    t = np.linspace(t_span[0], t_span[1], num_points)
+    Y = sol.sol(t).astype(np.float32)
+    results = {"t": t.astype(np.float32)}
     for i, name in enumerate(COMPARTMENTS):
-        results[name] = sol.y[i]
+        results[name] = Y[i]
     return results
+
+
+def run_simulation_batch(param_grid, y0, t_span, num_points=1000):
+    n_sweep, n_comp = len(param_grid), len(COMPARTMENTS)
+
+    def rhs(t, y_flat):
+        Y = y_flat.reshape(n_sweep, n_comp)
+        return np.concatenate([derivatives(t, Y[k], p) for k, p in enumerate(param_grid)])
+
+    def jac(t, y_flat):
+        Y = y_flat.reshape(n_sweep, n_comp)
+        return block_diag(*[jacobian(t, Y[k], p) for k, p in enumerate(param_grid)])
+
+    sol = solve_ivp(
+        fun=rhs,
+        t_span=t_span,
+        y0=np.tile(np.asarray(y0, dtype=float), n_sweep),
+        method='LSODA',
+        rtol=1e-6,
+        atol=1e-8,
+        dense_output=True,
+        jac=jac if jacobian else None,
+    )
+    if not sol.success:
+        raise RuntimeError(f"ODE solver failed: {sol.message}")
+    t = np.linspace(t_span[0], t_span[1], num_points)
+    Y = sol.sol(t).reshape(n_sweep, n_comp, num_points).astype(np.float32)
+    t = t.astype(np.float32)
+    return [
+        {"t": t, **{name: Y[k, i] for i, name in enumerate(COMPARTMENTS)}}
+        for k in range(n_sweep)
+    ]
 ```
 
 - The `fun` argument MUST be `lambda t, y: derivatives(t, y, params)` — wrapping params via closure.
 - `y0` is passed directly as a list. Do NOT convert or reshape it.
 - `t_span` is a tuple `(0, days)`. Do NOT unpack it differently.
+- Do NOT add `max_step` or `t_eval` — LSODA picks its own steps and `dense_output` interpolates onto the output grid.
 - Returns `{"t": ndarray, "compartment_name": ndarray, ...}` with keys = "t" + COMPARTMENTS
+- Integration runs in float64; only the returned arrays are downcast to float32 (they are for display and metrics, not further integration).
+- `run_simulation_batch` takes a list of params dicts and integrates them as ONE stacked ODE system (one solver run instead of one per dict). Returns a list of result dicts in the same format, one per params dict.
 
 ### app.py
 - A Streamlit application.
@@ -67,7 +141,7 @@ def run_simulation(params, y0, t_span, num_points=1000):
 - Sidebar: `st.sidebar.slider()` for each parameter (default=paper value, min=slider_min, max=slider_max, step appropriate to scale).
 - Sidebar: "Reset to Paper Defaults" button using `st.sidebar.button`.
 - Main area: `st.title()` with model name, `st.markdown()` with paper title.
-- Main area: Plotly line chart (`go.Figure` with `go.Scatter`) showing all compartments over time.
+- Main area: Plotly line chart (`go.Figure` with `go.Scattergl` WebGL traces) showing all compartments over time.
 - Main area: Display key metrics (peak day, peak cases, R0 if computable).
 - Use `st.plotly_chart(fig, use_container_width=True)`.
 
@@ -76,7 +150,7 @@ def run_simulation(params, y0, t_span, num_points=1000):
 - Parameter values are the paper's default values (just the float, not the full Parameter object).
 
 ### requirements.txt
-- List: streamlit, plotly, scipy, numpy
+- List: streamlit, plotly, scipy, numpy, numba
 
 ## Important Rules
 - All files must be syntactically valid Python (or JSON for config.json).
@@ -86,21 +160,43 @@ def run_simulation(params, y0, t_span, num_points=1000):
 
 You MUST call the submit_files tool with all generated files."""
 
+_TOOL_SCHEMA = GeneratedFiles.model_json_schema()
+
+_CACHE_DIRNAME = ".builder_cache"
+_FILENAMES = ("model.py", "solver.py", "app.py", "config.json", "requirements.txt")
+
+
+def _cache_key(model_json: str) -> str:
+    """Hash the model spec together with everything else that shapes the output."""
+    h = hashlib.sha256()
+    for part in (MODEL, BUILDER_SYSTEM_PROMPT, model_json):
+        h.update(part.encode())
+    return h.hexdigest()[:16]
+
 
 def generate_simulator(model: EpidemicModel, output_dir: Path) -> Path:
     """Generate a complete Streamlit simulator from an EpidemicModel spec.
 
+    Results are cached under `output_dir/.builder_cache/<model hash>`, so
+    re-submitting the same model skips the API call entirely.
+
     Returns the output directory path.
     """
-    client = anthropic.Anthropic()
-
+    output_dir = Path(output_dir)
     model_json = model.model_dump_json(indent=2)
-    tool_schema = GeneratedFiles.model_json_schema()
+
+    cache_dir = output_dir / _CACHE_DIRNAME / _cache_key(model_json)
+    if all((cache_dir / name).is_file() for name in _FILENAMES):
+        for filename in _FILENAMES:
+            (output_dir / filename).write_bytes((cache_dir / filename).read_bytes())
+        return output_dir
+
+    client = get_client()
 
     api_kwargs = dict(
         model=MODEL,
         max_tokens=16384,
-        system=BUILDER_SYSTEM_PROMPT,
+        system=cached_text(BUILDER_SYSTEM_PROMPT),
         messages=[{
             "role": "user",
             "content": f"Generate a complete simulator for this epidemic model:\n\n{model_json}",
@@ -108,7 +204,7 @@ def generate_simulator(model: EpidemicModel, output_dir: Path) -> Path:
         tools=[{
             "name": "submit_files",
             "description": "Submit all generated simulator files. You MUST use this tool.",
-            "input_schema": tool_schema,
+            "input_schema": _TOOL_SCHEMA,
         }],
     )
     if "opus-4-6" in MODEL:
@@ -116,8 +212,7 @@ def generate_simulator(model: EpidemicModel, output_dir: Path) -> Path:
         api_kwargs["output_config"] = {"effort": "high"}
         api_kwargs["max_tokens"] = 32000
 
-    with client.messages.stream(**api_kwargs) as stream:
-        response = stream.get_final_message()
+    response = cached_final_message(client, **api_kwargs)
 
     # Extract tool_use result
     files = None
@@ -129,9 +224,8 @@ def generate_simulator(model: EpidemicModel, output_dir: Path) -> Path:
     if files is None:
         raise ValueError("No submit_files tool_use block found in response")
 
-    # Write files to output directory
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # Write files to output directory and the cache
+    cache_dir.mkdir(parents=True, exist_ok=True)
 
     file_mapping = {
         "model.py": files.model_py,
@@ -145,6 +239,8 @@ def generate_simulator(model: EpidemicModel, output_dir: Path) -> Path:
         # Fix escaped newlines — LLM sometimes returns literal \n instead of real newlines
         if '\\n' in content[:200]:
             content = content.replace('\\n', '\n').replace('\\t', '\t')
-        (output_dir / filename).write_text(content)
+        data = content.encode("utf-8")
+        (output_dir / filename).write_bytes(data)
+        (cache_dir / filename).write_bytes(data)
 
     return output_dir
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import os
 
-import anthropic
-
+from episim.agents._cache import cached_final_message
+from episim.agents._client import cached_text, get_client
 from episim.core.model_spec import EpidemicModel, StandaloneScript
+from episim.core.paper_loader import paper_excerpt
 
 MODEL = os.environ.get("EPISIM_MODEL", "claude-sonnet-4-5-20250929")
 
@@ -96,13 +97,13 @@ def generate_standalone(model: EpidemicModel, paper_text: str) -> StandaloneScri
     Returns:
         StandaloneScript with filename, code, and description.
     """
-    client = anthropic.Anthropic()
+    client = get_client()
 
     tool_schema = StandaloneScript.model_json_schema()
 
-    # Truncate paper text — the model spec has all the details;
+    # Key sections only — the model spec has all the details;
     # paper text is just for docstring context
-    paper_context = paper_text[:8000]
+    paper_context = paper_excerpt(paper_text)
 
     user_message = (
         f"Generate a standalone reproduction script for this epidemic model:\n\n"
@@ -113,7 +114,7 @@ def generate_standalone(model: EpidemicModel, paper_text: str) -> StandaloneScri
     api_kwargs = dict(
         model=MODEL,
         max_tokens=8192,
-        system=CODER_SYSTEM_PROMPT,
+        system=cached_text(CODER_SYSTEM_PROMPT),
         messages=[{"role": "user", "content": user_message}],
         tools=[{
             "name": "submit_script",
@@ -126,8 +127,7 @@ def generate_standalone(model: EpidemicModel, paper_text: str) -> StandaloneScri
         api_kwargs["output_config"] = {"effort": "high"}
         api_kwargs["max_tokens"] = 16000
 
-    with client.messages.stream(**api_kwargs) as stream:
-        response = stream.get_final_message()
+    response = cached_final_message(client, **api_kwargs)
 
     for block in response.content:
         if block.type == "tool_use" and block.name == "submit_script":
@@ -3,14 +3,29 @@
 from __future__ import annotations
 
 import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-import anthropic
-
+from episim.agents._cache import cached_final_message
+from episim.agents._client import cached_text, get_client
+from episim.agents.validator import validate
 from episim.core.model_spec import EpidemicModel, ValidationReport
 
 MODEL = os.environ.get("EPISIM_MODEL", "claude-sonnet-4-5-20250929")
 
+# Independent fix candidates requested per debug round
+SPECULATIVE_CANDIDATES = 2
+
+# Per-candidate steer appended to the request — identical requests would share a
+# response cache entry and come back as the same fix. Bounds the candidate count.
+_FIX_HINTS = [
+    "Start from model.py: check every term, sign and compartment index of the ODE system against the specification.",
+    "Start from solver.py and config.json: check parameter passing, initial-condition order and integrator settings.",
+    "Re-derive the equations from the specification and rewrite derivatives() from scratch if it disagrees.",
+]
+
 DEBUGGER_SYSTEM_PROMPT = """You are an expert Python debugger specializing in scientific computing and epidemic modeling. A generated epidemic simulator has failed validation — some metrics don't match the paper's expected values, or the code crashed.
 
 You will receive:
@@ -26,7 +41,7 @@ Common issues to look for:
 - solver.py doesn't pass parameters correctly to derivatives() — the correct pattern is: `lambda t, y: derivatives(t, y, params)`
 - solver.py using wrong solve_ivp arguments (e.g. passing params as extra arg instead of via closure)
 - Initial conditions in wrong order relative to COMPARTMENTS
-- Numerical issues — if RK45 fails, switch to method='LSODA' or 'Radau' for stiff systems, and try max_step=0.5
+- Numerical issues — if LSODA fails, switch to method='Radau' or 'BDF' for very stiff systems, or tighten rtol
 - derivatives() returning wrong number of values vs COMPARTMENTS length
 - Import errors or typos in generated code
 
@@ -34,11 +49,13 @@ IMPORTANT: solver.py MUST follow this exact pattern:
 ```python
 sol = solve_ivp(
     fun=lambda t, y: derivatives(t, y, params),
-    t_span=t_span, y0=y0, method='RK45',
-    t_eval=t_eval, max_step=1.0, rtol=1e-8, atol=1e-8
+    t_span=t_span, y0=y0, method='LSODA',
+    rtol=1e-6, atol=1e-8, dense_output=True,
 )
+t = np.linspace(t_span[0], t_span[1], num_points)
+Y = sol.sol(t)
 ```
-If RK45 fails for stiff systems, change method to 'LSODA' which auto-detects stiffness.
+LSODA auto-detects stiffness. If it still fails, change method to 'Radau' or 'BDF'.
 
 Return only the files that need fixing. Do not modify files that are correct.
 
@@ -49,12 +66,14 @@ def debug_and_fix(
     report: ValidationReport,
     output_dir: Path,
     model: EpidemicModel,
+    hint: str | None = None,
 ) -> dict[str, str]:
     """Analyze validation failure and return patched files.
 
+    `hint` is an optional line steering where the Debugger starts looking.
     Returns dict mapping filename -> updated content for files that need fixes.
     """
-    client = anthropic.Anthropic()
+    client = get_client()
     output_dir = Path(output_dir)
 
     # Read current generated files
@@ -77,6 +96,9 @@ def debug_and_fix(
     parts.append("\n## Validation Report")
     parts.append(report.model_dump_json(indent=2))
 
+    if hint:
+        parts.append(f"\n## Suggested Approach\n{hint}")
+
     user_message = "\n\n".join(parts)
 
     # Define tool schema for returning fixes
@@ -99,7 +121,7 @@ def debug_and_fix(
     api_kwargs = dict(
         model=MODEL,
         max_tokens=16384,
-        system=DEBUGGER_SYSTEM_PROMPT,
+        system=cached_text(DEBUGGER_SYSTEM_PROMPT),
         messages=[{"role": "user", "content": user_message}],
         tools=[{
             "name": "submit_fixes",
@@ -112,8 +134,7 @@ def debug_and_fix(
         api_kwargs["output_config"] = {"effort": "high"}
         api_kwargs["max_tokens"] = 32000
 
-    with client.messages.stream(**api_kwargs) as stream:
-        response = stream.get_final_message()
+    response = cached_final_message(client, **api_kwargs)
 
     for block in response.content:
         if block.type == "tool_use" and block.name == "submit_fixes":
@@ -127,3 +148,62 @@ def apply_fixes(fixes: dict[str, str], output_dir: Path) -> None:
     output_dir = Path(output_dir)
     for filename, content in fixes.items():
         (output_dir / filename).write_text(content)
+
+
+def _try_fix(
+    report: ValidationReport,
+    output_dir: Path,
+    model: EpidemicModel,
+    hint: str,
+) -> tuple[dict[str, str], ValidationReport]:
+    """Get one fix from the Debugger and validate it in a scratch copy of output_dir."""
+    fixes = debug_and_fix(report, output_dir, model, hint=hint)
+    with tempfile.TemporaryDirectory(prefix="episim_fix_") as tmp:
+        stage = Path(tmp)
+        shutil.copytree(
+            output_dir, stage, dirs_exist_ok=True,
+            ignore=shutil.ignore_patterns(".builder_cache", "__pycache__"),
+        )
+        apply_fixes(fixes, stage)
+        return fixes, validate(stage, model)
+
+
+def speculative_fix(
+    report: ValidationReport,
+    output_dir: Path,
+    model: EpidemicModel,
+    candidates: int = SPECULATIVE_CANDIDATES,
+) -> dict[str, str]:
+    """Request several fixes in parallel and return the one that validates best.
+
+    Each candidate gets its own hint (at most len(_FIX_HINTS) candidates). The
+    first to pass every metric is returned at once, without waiting on the
+    rest; otherwise the one that ran cleanly and passed the most metrics.
+    Candidates that raise are skipped — if all of them do, the last error
+    propagates. output_dir is not modified.
+    """
+    output_dir = Path(output_dir)
+    hints = _FIX_HINTS[:candidates]
+    best, best_score, error = None, None, None
+
+    executor = ThreadPoolExecutor(max_workers=len(hints))
+    try:
+        futures = [executor.submit(_try_fix, report, output_dir, model, hint) for hint in hints]
+        for future in as_completed(futures):
+            try:
+                fixes, candidate = future.result()
+            except Exception as e:
+                error = e
+                continue
+            if candidate.all_passed:
+                return fixes
+            score = (candidate.error is None, sum(m.passed for m in candidate.metrics))
+            if best_score is None or score > best_score:
+                best, best_score = fixes, score
+    finally:
+        # Losers still running finish in the background; their scratch dirs clean up after them
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if best is None:
+        raise error
+    return best
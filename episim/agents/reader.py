@@ -8,8 +8,8 @@ from __future__ import annotations
 import os
 from typing import Callable
 
-import anthropic
-
+from episim.agents._cache import cache_key, load_cached, store_cached
+from episim.agents._client import cached_text, get_client
 from episim.core.model_spec import EpidemicModel
 
 MODEL = os.environ.get("EPISIM_MODEL", "claude-sonnet-4-5-20250929")
@@ -45,9 +45,22 @@ You must identify and extract:
    - Access parameters via params['name'] dict lookups
    - Use only basic math operations (no imports needed inside the function)
    - Return a list of derivatives in the same order as compartments
-7. **Simulation days** — total simulation duration
-8. **Population** — total population N
-9. **Expected results** — key metrics reported in the paper that we can validate against:
+7. **Jacobian (optional)** — for stiff models (many compartments, rates differing by orders of magnitude), also provide jacobian_system:
+   ```python
+   def jacobian(t, y, params):
+       S, I, R = y
+       N = S + I + R
+       beta = params['beta']
+       gamma = params['gamma']
+       # J[i][j] = d(dy_i/dt) / d(y_j), treating N as constant if the paper does
+       return [[-beta*I/N, -beta*S/N, 0.0],
+               [beta*I/N, beta*S/N - gamma, 0.0],
+               [0.0, gamma, 0.0]]
+   ```
+   Same signature rules as ode_system; return an n×n nested list in compartment order. Leave it null if you are not certain every partial derivative is correct — a wrong Jacobian is worse than none.
+8. **Simulation days** — total simulation duration
+9. **Population** — total population N
+10. **Expected results** — key metrics reported in the paper that we can validate against:
    - peak_day, peak_cases, R0, attack_rate, or custom metrics
    - Include the value, source reference (e.g. "Figure 3", "Table 2"), and tolerance (default 0.05)
 
@@ -70,7 +83,7 @@ def extract_model(
     Returns:
         (model, thinking_text) where thinking_text captures the full reasoning.
     """
-    client = anthropic.Anthropic()
+    client = get_client()
 
     tool_schema = EpidemicModel.model_json_schema()
 
@@ -81,8 +94,9 @@ def extract_model(
             api_kwargs = dict(
                 model=MODEL,
                 max_tokens=16000,
-                system=READER_SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": context}],
+                system=cached_text(READER_SYSTEM_PROMPT),
+                # Cached too — the retry re-sends the same paper + knowledge context
+                messages=[{"role": "user", "content": cached_text(context)}],
                 tools=[{
                     "name": "submit_model",
                     "description": "Submit the extracted epidemic model specification. You MUST use this tool.",
@@ -94,21 +108,24 @@ def extract_model(
                 api_kwargs["output_config"] = {"effort": "max"}
                 api_kwargs["max_tokens"] = 32000
 
-            with client.messages.stream(**api_kwargs) as stream:
-                # Match official Anthropic streaming docs exactly:
-                # check delta.type directly, no state tracking needed
-                for event in stream:
-                    if event.type == "content_block_delta":
-                        delta = event.delta
-                        delta_type = getattr(delta, "type", None)
-                        if delta_type == "thinking_delta":
-                            chunk = getattr(delta, "thinking", "")
-                            if chunk:
-                                thinking_text += chunk
-                                if on_thinking:
-                                    on_thinking(chunk)
-
-                response = stream.get_final_message()
+            key = cache_key(api_kwargs)
+            response = load_cached(key)
+            if response is None:
+                with client.messages.stream(**api_kwargs) as stream:
+                    # Match official Anthropic streaming docs exactly:
+                    # check delta.type directly, no state tracking needed
+                    for event in stream:
+                        if event.type == "content_block_delta":
+                            delta = event.delta
+                            delta_type = getattr(delta, "type", None)
+                            if delta_type == "thinking_delta":
+                                chunk = getattr(delta, "thinking", "")
+                                if chunk:
+                                    thinking_text += chunk
+                                    if on_thinking:
+                                        on_thinking(chunk)
+
+                    response = stream.get_final_message()
 
             # Also capture thinking from final message blocks
             # (fallback for non-streaming or when events were missed)
@@ -116,11 +133,14 @@ def extract_model(
                 for block in response.content:
                     if block.type == "thinking":
                         thinking_text += getattr(block, "thinking", "") + "\n"
+                if thinking_text and on_thinking:
+                    on_thinking(thinking_text)
 
             # Extract tool_use input
             for block in response.content:
                 if block.type == "tool_use" and block.name == "submit_model":
                     model = EpidemicModel.model_validate(block.input)
+                    store_cached(key, response)
                     return model, thinking_text.strip()
 
             raise ValueError("No submit_model tool_use block found in response")
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import os
 
-import anthropic
-
+from episim.agents._cache import cached_final_message
+from episim.agents._client import cached_text, get_client
 from episim.core.model_spec import EpidemicModel, PaperSummary
+from episim.core.paper_loader import paper_excerpt
 
 MODEL = os.environ.get("EPISIM_MODEL", "claude-sonnet-4-5-20250929")
 
@@ -38,19 +39,19 @@ def summarize_paper(paper_text: str, model: EpidemicModel) -> PaperSummary:
     Returns:
         PaperSummary with structured summary fields.
     """
-    client = anthropic.Anthropic()
+    client = get_client()
 
     tool_schema = PaperSummary.model_json_schema()
 
     user_message = (
-        f"<paper>\n{paper_text}\n</paper>\n\n"
+        f"<paper>\n{paper_excerpt(paper_text, limit=16000)}\n</paper>\n\n"
         f"<extracted_model>\n{model.model_dump_json(indent=2)}\n</extracted_model>"
     )
 
     api_kwargs = dict(
         model=MODEL,
         max_tokens=4096,
-        system=SUMMARIZER_SYSTEM_PROMPT,
+        system=cached_text(SUMMARIZER_SYSTEM_PROMPT),
         messages=[{"role": "user", "content": user_message}],
         tools=[{
             "name": "submit_summary",
@@ -63,8 +64,7 @@ def summarize_paper(paper_text: str, model: EpidemicModel) -> PaperSummary:
         api_kwargs["output_config"] = {"effort": "medium"}
         api_kwargs["max_tokens"] = 8000
 
-    with client.messages.stream(**api_kwargs) as stream:
-        response = stream.get_final_message()
+    response = cached_final_message(client, **api_kwargs)
 
     for block in response.content:
         if block.type == "tool_use" and block.name == "submit_summary":
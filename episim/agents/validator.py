@@ -2,25 +2,34 @@
 
 from __future__ import annotations
 
+import contextlib
+import io
 import json
-import subprocess
+import os
+import runpy
 import sys
-import textwrap
+import traceback
 from pathlib import Path
 
-from episim.core.model_spec import EpidemicModel, MetricResult, ValidationReport
+from episim.core._mp import CTX, start_process
+from episim.core.model_spec import EpidemicModel, ExpectedResult, MetricResult, ValidationReport
+
+_TIMEOUT = 30
 
 # Metric computation snippets keyed by metric name.
-# Each returns a float from `results` dict and `params` dict.
+# Each returns a float from `results`, `params`, and the shared locals below.
 _METRIC_COMPUTATIONS = {
-    "peak_day": 'results["t"][np.argmax(results[infected_compartment])]',
-    "peak_cases": "float(np.max(results[infected_compartment]))",
+    "peak_day": "t[peak_idx]",
+    "peak_cases": "infected[peak_idx]",
     "R0": 'params["beta"] / params["gamma"]',
     "attack_rate": '1.0 - results["S"][-1] / population',
-    "final_recovered": 'float(results["R"][-1])',
-    "epidemic_duration": 'float(np.sum(results[infected_compartment] > population * 0.001))',
+    "final_recovered": 'results["R"][-1]',
+    "epidemic_duration": "np.count_nonzero(infected > population * 0.001)",
 }
 
+# Metrics that read the infected curve — it and its argmax are computed once, up front
+_CURVE_METRICS = {"peak_day", "peak_cases", "epidemic_duration"}
+
 
 def _generate_validate_script(model: EpidemicModel) -> str:
     """Generate a _validate.py script that runs the simulator and prints metrics as JSON."""
@@ -37,15 +46,21 @@ def _generate_validate_script(model: EpidemicModel) -> str:
     is_standard_model = len(model.compartments) <= 4
 
     metric_lines = []
+    if any(er.metric in _CURVE_METRICS for er in model.expected_results):
+        metric_lines += [
+            '    t = results["t"]',
+            f'    infected = np.asarray(results["{infected}"])',
+            "    peak_idx = int(np.argmax(infected))",
+        ]
     for er in model.expected_results:
         comp = _METRIC_COMPUTATIONS.get(er.metric)
         # Skip hardcoded R0 formula for complex models — it gives wrong results
         if er.metric == "R0" and not is_standard_model:
             comp = None
         if comp:
-            expr = comp.replace("infected_compartment", f'"{infected}"')
+            # float() — solvers return float32 arrays, whose scalars json can't encode
             metric_lines.append(
-                f'    metrics.append({{"metric": "{er.metric}", "actual": {expr}}})'
+                f'    metrics.append({{"metric": "{er.metric}", "actual": float({comp})}})'
             )
         else:
             metric_lines.append(
@@ -72,7 +87,6 @@ def _generate_validate_script(model: EpidemicModel) -> str:
         "",
         "try:",
         "    results = run_simulation(params, y0, t_span)",
-        f'    infected_compartment = "{infected}"',
         "    metrics = []",
         metrics_block,
         "    print(json.dumps(metrics))",
@@ -83,6 +97,69 @@ def _generate_validate_script(model: EpidemicModel) -> str:
     return "\n".join(lines) + "\n"
 
 
+def _run_validate_script(conn, output_dir: str) -> None:
+    """Child-process entry: run _validate.py, send back (returncode, stdout, stderr)."""
+    os.chdir(output_dir)
+    sys.path.insert(0, output_dir)
+    out, err = io.StringIO(), io.StringIO()
+    returncode = 0
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            runpy.run_path("_validate.py", run_name="__main__")
+        except SystemExit as e:
+            # Interpreter exit semantics: None is success, any other non-int is printed and exits 1
+            if e.code is None:
+                returncode = 0
+            elif isinstance(e.code, int):
+                returncode = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+        except BaseException:
+            traceback.print_exc()
+            returncode = 1
+    conn.send((returncode, out.getvalue(), err.getvalue()))
+    conn.close()
+
+
+def _run_script(output_dir: Path) -> tuple[int, str, str] | None:
+    """Run _validate.py in a forked child; return (returncode, stdout, stderr), or None on timeout."""
+    # Forked from a server with numpy/scipy already imported — no interpreter start-up per attempt
+    parent_conn, child_conn = CTX.Pipe(duplex=False)
+    proc = CTX.Process(target=_run_validate_script, args=(child_conn, str(output_dir.resolve())))
+    start_process(proc)
+    child_conn.close()
+    try:
+        if not parent_conn.poll(_TIMEOUT):
+            return None
+        try:
+            return parent_conn.recv()
+        except EOFError:  # child died without reporting (segfault, os._exit, ...)
+            proc.join(1)
+            return proc.exitcode or 1, "", f"Validation process exited with code {proc.exitcode}"
+    finally:
+        if proc.is_alive():
+            proc.terminate()
+        proc.join(1)
+        parent_conn.close()
+
+
+def _compare_metric(er: ExpectedResult, actual: float) -> MetricResult:
+    """Score one simulated value against the paper's claim, within er.tolerance."""
+    if er.value == 0:
+        match_pct = 0.0 if actual == 0 else 100.0
+    else:
+        match_pct = abs(1 - actual / er.value) * 100
+
+    return MetricResult(
+        metric=er.metric,
+        expected=er.value,
+        actual=actual,
+        match_pct=round(match_pct, 2),
+        passed=match_pct <= er.tolerance * 100,
+    )
+
+
 def validate(output_dir: Path, model: EpidemicModel) -> ValidationReport:
     """Run the generated simulator and compare metrics against expected results.
 
@@ -90,43 +167,53 @@ def validate(output_dir: Path, model: EpidemicModel) -> ValidationReport:
     """
     output_dir = Path(output_dir)
 
+    # Syntax errors need no child process — catch them with a compile() pre-flight
+    for fname in ("model.py", "solver.py"):
+        path = output_dir / fname
+        if not path.is_file():
+            continue
+        try:
+            compile(path.read_bytes(), fname, "exec")
+        except SyntaxError as e:
+            return ValidationReport(
+                paper_title=model.paper_title,
+                model_name=model.name,
+                metrics=[],
+                all_passed=False,
+                attempts=0,
+                error=f"Validation script failed: {''.join(traceback.format_exception_only(e)).strip()}",
+            )
+
     # Write validation script
     script = _generate_validate_script(model)
     script_path = output_dir / "_validate.py"
     script_path.write_text(script)
 
-    # Run via subprocess
-    try:
-        result = subprocess.run(
-            [sys.executable, "_validate.py"],
-            cwd=str(output_dir),
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-    except subprocess.TimeoutExpired:
+    result = _run_script(output_dir)
+    if result is None:
         return ValidationReport(
             paper_title=model.paper_title,
             model_name=model.name,
             metrics=[],
             all_passed=False,
             attempts=0,
-            error="Validation script timed out after 30 seconds",
+            error=f"Validation script timed out after {_TIMEOUT} seconds",
         )
+    returncode, stdout, stderr = result
 
-    if result.returncode != 0:
+    if returncode != 0:
         return ValidationReport(
             paper_title=model.paper_title,
             model_name=model.name,
             metrics=[],
             all_passed=False,
             attempts=0,
-            error=f"Validation script failed: {result.stderr.strip()}",
+            error=f"Validation script failed: {stderr.strip()}",
         )
 
     # Parse output
     try:
-        actual_metrics = json.loads(result.stdout.strip())
+        actual_metrics = json.loads(stdout.strip())
     except json.JSONDecodeError:
         return ValidationReport(
             paper_title=model.paper_title,
@@ -134,7 +221,7 @@ def validate(output_dir: Path, model: EpidemicModel) -> ValidationReport:
             metrics=[],
             all_passed=False,
             attempts=0,
-            error=f"Could not parse validation output: {result.stdout[:500]}",
+            error=f"Could not parse validation output: {stdout[:500]}",
         )
 
     # Build expected lookup
@@ -150,18 +237,7 @@ def validate(output_dir: Path, model: EpidemicModel) -> ValidationReport:
         if er is None or actual_val is None:
             continue
 
-        if er.value == 0:
-            match_pct = 0.0 if actual_val == 0 else 100.0
-        else:
-            match_pct = abs(1 - actual_val / er.value) * 100
-
-        metric_results.append(MetricResult(
-            metric=metric_name,
-            expected=er.value,
-            actual=actual_val,
-            match_pct=round(match_pct, 2),
-            passed=match_pct <= er.tolerance * 100,
-        ))
+        metric_results.append(_compare_metric(er, actual_val))
 
     # If simulation ran but no metrics could be computed (all custom/unknown),
     # treat as pass — the simulation works, we just can't verify numbers.
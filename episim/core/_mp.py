@@ -0,0 +1,36 @@
+"""Child processes for generated code, forked from a server with the scientific stack preloaded.
+
+Process targets live in importable modules, so children never need the parent's
+`__main__`. Under `streamlit run` that module is app.py, and multiprocessing
+would otherwise re-execute it as `__mp_main__` in every child it starts.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import sys
+import threading
+import types
+
+if "forkserver" in mp.get_all_start_methods():
+    CTX = mp.get_context("forkserver")
+    CTX.set_forkserver_preload(["numpy", "scipy.integrate", "scipy.linalg", "numba"])
+else:
+    CTX = mp.get_context("spawn")
+
+_START_LOCK = threading.Lock()
+
+
+def start_process(proc) -> None:
+    """Start `proc` without sending the parent's main module along to the child."""
+    with _START_LOCK:
+        main = sys.modules["__main__"]
+        # A main module without __file__ or __spec__ is left alone by the child
+        stub = types.ModuleType("__main__")
+        sys.modules["__main__"] = stub
+        try:
+            proc.start()
+        finally:
+            # Streamlit installs a fresh __main__ on each rerun — don't clobber one set meanwhile
+            if sys.modules["__main__"] is stub:
+                sys.modules["__main__"] = main
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 
 _KNOWLEDGE_DIR = Path(__file__).resolve().parent.parent / "knowledge"
@@ -13,14 +14,16 @@ _SECTIONS = [
 ]
 
 
+@cache
+def _load_knowledge(kdir: Path) -> str:
+    """Read and tag the knowledge files once per directory — they are static package data."""
+    return "\n\n".join(
+        f"<{tag}>\n{(kdir / filename).read_text()}\n</{tag}>"
+        for tag, filename in _SECTIONS
+    )
+
+
 def build_context(paper_text: str, knowledge_dir: Path | None = None) -> str:
     """Assemble paper text and knowledge base files into an XML-tagged context string."""
     kdir = knowledge_dir or _KNOWLEDGE_DIR
-
-    parts = [f"<paper>\n{paper_text}\n</paper>"]
-
-    for tag, filename in _SECTIONS:
-        content = (kdir / filename).read_text()
-        parts.append(f"<{tag}>\n{content}\n</{tag}>")
-
-    return "\n\n".join(parts)
+    return f"<paper>\n{paper_text}\n</paper>\n\n{_load_knowledge(kdir)}"
@@ -0,0 +1,34 @@
+"""Downsampling for plotted curves — fewer points to the browser, same visible shape."""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets downsampling — keeps peaks, drops redundant points.
+
+    Returns the inputs unchanged when they are already at or below `n_out`.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    # Interior points split into n_out - 2 buckets; first and last are always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket is the third triangle vertex
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs(
+            (x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a])
+        )
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+
+    return x[keep], y[keep]
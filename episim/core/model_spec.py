@@ -27,6 +27,7 @@ class EpidemicModel(BaseModel):
     parameters: dict[str, Parameter]
     initial_conditions: dict[str, float]
     ode_system: str  # Complete Python function as string
+    jacobian_system: str | None = None  # Optional analytic Jacobian, same signature
     simulation_days: int
     population: float
     expected_results: list[ExpectedResult]
@@ -13,11 +13,13 @@ from episim.agents.reader import extract_model
 from episim.agents.summarizer import summarize_paper
 from episim.agents.builder import generate_simulator
 from episim.agents.validator import validate, write_report
-from episim.agents.debugger import debug_and_fix, apply_fixes
+from episim.agents.debugger import SPECULATIVE_CANDIDATES, apply_fixes, speculative_fix
 from episim.agents.coder import generate_standalone
 
 MAX_RETRIES = 3
 
+_SLUG_RE = re.compile(r"[^\w\-.]")
+
 
 def _slugify(source: str) -> str:
     """Convert a paper source (path/URL/ID) into a safe directory name."""
@@ -28,7 +30,7 @@ def _slugify(source: str) -> str:
         name = source.rstrip("/").rsplit("/", 1)[-1]
     else:
         name = source
-    name = re.sub(r"[^\w\-.]", "_", name)
+    name = _SLUG_RE.sub("_", name)
     return name[:80]
 
 
@@ -128,8 +130,8 @@ def run_pipeline(paper_source: str, output_base: str = "output") -> Path:
             _log(f"Error: {report.error}")
 
         if attempt < MAX_RETRIES:
-            _log("Debugger agent analyzing and patching (high effort)...")
-            fixes = debug_and_fix(report, output_dir, model)
+            _log(f"Debugger agent proposing {SPECULATIVE_CANDIDATES} candidate fixes (high effort)...")
+            fixes = speculative_fix(report, output_dir, model)
             apply_fixes(fixes, output_dir)
             _log(f"Applied fixes to: {', '.join(fixes.keys())}")
 
@@ -2,26 +2,70 @@
 
 from __future__ import annotations
 
+import os
 import re
 import tempfile
+import threading
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import fitz  # PyMuPDF
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 _ARXIV_URL_RE = re.compile(r"arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5})")
 _ARXIV_ID_RE = re.compile(r"^\d{4}\.\d{4,5}$")
 
+# One pooled session for every download — later papers reuse the TLS connection
+_ARXIV_PDF_URL = "https://arxiv.org/pdf/{}"
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+))
+
+# Downloaded PDFs, reused across runs; least-recently-used files go past the cap
+_ARXIV_CACHE_DIR = Path(tempfile.gettempdir()) / "episim_arxiv_cache"
+_ARXIV_CACHE_MAX_BYTES = 1 << 30
+
+# Concurrent loads in load_papers — kept small to stay polite to arxiv
+_LOAD_WORKERS = 4
+
+# PyMuPDF is not thread-safe — concurrent loads overlap downloads, never extraction
+_FITZ_LOCK = threading.Lock()
+
+# A heading on its own line, optionally numbered ("2.", "II.", "3 ")
+_SECTION_HEADING_RE = re.compile(
+    r"^[ \t]*(?:[IVX]+\.|\d+\.?)?[ \t]*"
+    r"(abstract|introduction|background|methods?|materials and methods|model|results"
+    r"|discussion|conclusions?|references|acknowledge?ments?)[ \t]*:?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+_SECTION_ALIASES = {"method": "methods", "conclusions": "conclusion", "acknowledgments": "acknowledgements"}
+
+# Sections that carry the paper's framing and findings, in reading order
+_KEY_SECTIONS = ("abstract", "introduction", "results", "discussion", "conclusion")
+
 
 def load_paper(source: str) -> str:
     """Load a paper from a local PDF path, arxiv URL, or bare arxiv ID.
 
-    Returns the extracted text content.
+    Returns the extracted text content. Results are memoized per process —
+    local files by path, mtime and size, so an edited PDF is re-read.
     """
     source = source.strip()
 
+    # Local PDF path — one stat, checked first so uploads skip the regexes
+    path = Path(source)
+    if path.is_file():
+        st = path.stat()
+        return _load_local(str(path.resolve()), st.st_mtime_ns, st.st_size)
+
     # Bare arxiv ID
     if _ARXIV_ID_RE.match(source):
         return _load_arxiv(source)
@@ -31,37 +75,119 @@ def load_paper(source: str) -> str:
     if m:
         return _load_arxiv(m.group(1))
 
-    # Local PDF path
-    path = Path(source)
-    if path.is_file():
-        return _extract_pdf(path)
-
     raise FileNotFoundError(f"Cannot load paper from: {source}")
 
 
+def load_papers(sources: list[str]) -> list[str]:
+    """Load several papers concurrently; texts are returned in source order.
+
+    Downloads overlap on the pooled session; PDF extraction stays serial. The
+    first failing source raises.
+    """
+    with ThreadPoolExecutor(max_workers=_LOAD_WORKERS) as executor:
+        return list(executor.map(load_paper, sources))
+
+
+def extract_sections(paper_text: str) -> dict[str, str]:
+    """Split paper text on recognised section headings → {lowercase name: body}.
+
+    Only the first occurrence of each section is kept. Returns {} when no
+    headings are found.
+    """
+    matches = list(_SECTION_HEADING_RE.finditer(paper_text))
+    sections: dict[str, str] = {}
+    for m, nxt in zip(matches, matches[1:] + [None]):
+        name = m.group(1).lower()
+        name = _SECTION_ALIASES.get(name, name)
+        body = paper_text[m.end():nxt.start() if nxt else len(paper_text)].strip()
+        if body:
+            sections.setdefault(name, body)
+    return sections
+
+
+@lru_cache(maxsize=8)
+def paper_excerpt(paper_text: str, limit: int = 8000) -> str:
+    """Key sections of the paper (abstract, introduction, results, ...) in at most `limit` chars.
+
+    Falls back to the start of the paper when no headings are recognised, and
+    cuts on a sentence boundary rather than mid-sentence.
+    """
+    sections = extract_sections(paper_text)
+    text = "\n\n".join(
+        f"{name.title()}\n{sections[name]}" for name in _KEY_SECTIONS if name in sections
+    ) or paper_text
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(". ", 0, limit)
+    return text[:cut + 1] if cut > limit // 2 else text[:limit]
+
+
+@lru_cache(maxsize=8)
+def _load_local(path: str, mtime_ns: int, size: int) -> str:
+    """Extract a local PDF; mtime_ns and size only make edits a cache miss."""
+    return _extract_pdf(Path(path))
+
+
+@lru_cache(maxsize=8)
 def _load_arxiv(arxiv_id: str) -> str:
-    """Download PDF from arxiv and extract text."""
-    url = f"https://arxiv.org/pdf/{arxiv_id}"
-    resp = requests.get(url, timeout=60)
-    resp.raise_for_status()
+    """Download PDF from arxiv (or reuse a cached copy) and extract text."""
+    cached = _ARXIV_CACHE_DIR / f"{arxiv_id}.pdf"
+    if cached.is_file() and cached.stat().st_size > 0:
+        os.utime(cached)  # mark as recently used
+        return _extract_pdf(cached)
 
-    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=True) as tmp:
-        tmp.write(resp.content)
-        tmp.flush()
-        return _extract_pdf(Path(tmp.name))
+    url = _ARXIV_PDF_URL.format(arxiv_id)
+    with _SESSION.get(url, timeout=60, stream=True) as resp:
+        resp.raise_for_status()
+        chunks = resp.iter_content(chunk_size=1 << 16)
 
+        # Rate limiting and "not found" pages come back as HTML — fail before parsing
+        first = next(chunks, b"")
+        if not first.startswith(b"%PDF"):
+            raise ValueError(f"arxiv did not return a PDF for {arxiv_id}")
+
+        data = bytearray(first)
+        for chunk in chunks:
+            data += chunk
+
+    _cache_pdf(cached, data)
+
+    # Parse straight from memory — no re-read of the cached file
+    return _extract_pdf(bytes(data))
 
-def _extract_pdf(path: Path) -> str:
-    """Extract text from a PDF file using PyMuPDF."""
-    doc = fitz.open(str(path))
-    pages: list[str] = []
 
-    for page in doc:
-        text = page.get_text("text")
-        if text.strip():
-            pages.append(text)
+def _cache_pdf(path: Path, data: bytes) -> None:
+    """Atomically store a downloaded PDF, then evict least-recently-used files over the cap.
+
+    Best-effort: a read-only or full temp dir just means no caching.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+        total = 0
+        for f in sorted(path.parent.glob("*.pdf"), key=lambda p: p.stat().st_mtime, reverse=True):
+            total += f.stat().st_size
+            if total > _ARXIV_CACHE_MAX_BYTES:
+                f.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _extract_pdf(source: Path | bytes) -> str:
+    """Extract text from a PDF file, or PDF bytes already in memory, using PyMuPDF."""
+    pages: list[str] = []
 
-    doc.close()
+    with _FITZ_LOCK:
+        doc = fitz.open(stream=source, filetype="pdf") if isinstance(source, bytes) else fitz.open(str(source))
+        for page in doc:
+            text = page.get_text("text")
+            if text.strip():
+                pages.append(text)
+        doc.close()
 
     full_text = "\n\n".join(pages)
     return _strip_headers_footers(full_text, pages)
@@ -72,26 +198,24 @@ def _strip_headers_footers(full_text: str, pages: list[str]) -> str:
     if len(pages) < 3:
         return full_text
 
-    # Collect first and last lines from each page
+    # Collect first and last lines from each page — after the outer strip() both
+    # ends are non-blank, so only those two lines need stripping
     edge_lines: list[str] = []
     for page_text in pages:
-        lines = [l.strip() for l in page_text.strip().splitlines() if l.strip()]
+        lines = page_text.strip().splitlines()
         if lines:
-            edge_lines.append(lines[0])
+            edge_lines.append(lines[0].strip())
             if len(lines) > 1:
-                edge_lines.append(lines[-1])
+                edge_lines.append(lines[-1].strip())
 
-    # Lines appearing on more than half the pages are likely headers/footers
+    # Short lines appearing on more than half the pages are likely headers/footers.
+    # Long lines (titles, caption tails) are dropped before counting.
     threshold = len(pages) // 2
-    counts = Counter(edge_lines)
-    repeated = {line for line, count in counts.items() if count >= threshold and len(line) < 80}
+    counts = Counter(line for line in edge_lines if len(line) < 80)
+    repeated = {line for line, count in counts.items() if count >= threshold}
 
     if not repeated:
         return full_text
 
     # Remove those lines
-    result_lines = []
-    for line in full_text.splitlines():
-        if line.strip() not in repeated:
-            result_lines.append(line)
-    return "\n".join(result_lines)
+    return "\n".join(line for line in full_text.splitlines() if line.strip() not in repeated)
@@ -0,0 +1,112 @@
+"""Simulation Worker — long-lived subprocess that runs a generated simulator.
+
+The worker imports numpy/scipy and the generated solver.py once, then serves
+simulation requests over a pipe. Interactive reruns pay interpreter start-up
+once per simulator instead of once per slider change, while generated code
+still never runs in the caller's process.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+
+from episim.core._mp import CTX, start_process
+
+
+class SimulationWorker:
+    """Persistent subprocess wrapping `solver.run_simulation` for one output dir."""
+
+    def __init__(self, output_dir: Path, timeout: float = 30.0):
+        self.timeout = timeout
+        # One request in flight at a time — Streamlit sessions share a cached worker
+        self._lock = threading.Lock()
+        self._conn, child_conn = CTX.Pipe()
+        self._proc = CTX.Process(
+            target=_worker_loop,
+            args=(child_conn, str(Path(output_dir).resolve())),
+            daemon=True,
+        )
+        # Not ctx.Process.start(): under Streamlit that re-runs app.py in the worker as __mp_main__
+        start_process(self._proc)
+        child_conn.close()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.is_alive()
+
+    def run_simulation(self, params: dict, y0: list[float], t_span: tuple) -> dict:
+        return self._call("run_simulation", params, y0, t_span)
+
+    def run_simulation_batch(self, param_grid: list[dict], y0: list[float], t_span: tuple) -> list[dict]:
+        return self._call("run_simulation_batch", param_grid, y0, t_span)
+
+    def _call(self, fn_name: str, *args):
+        with self._lock:
+            if not self.alive:
+                raise RuntimeError("Simulation worker is not running")
+
+            self._conn.send((fn_name, args))
+            if not self._conn.poll(self.timeout):
+                self._close()
+                raise TimeoutError(f"Simulation timed out after {self.timeout:g} seconds")
+
+            try:
+                ok, payload = self._conn.recv()
+            except EOFError:
+                self._close()
+                raise RuntimeError("Simulation worker exited unexpectedly")
+
+        if not ok:
+            raise RuntimeError(payload)
+        return payload
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._proc.is_alive():
+            self._proc.terminate()
+        self._proc.join(timeout=1)
+        self._conn.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def _worker_loop(conn, output_dir: str) -> None:
+    """Import the generated solver, then answer (fn_name, args) requests until EOF."""
+    sys.path.insert(0, output_dir)
+    try:
+        import solver
+        import_error = None
+    except Exception as e:
+        solver = None
+        import_error = f"Could not import solver.py: {type(e).__name__}: {e}"
+
+    while True:
+        try:
+            fn_name, args = conn.recv()
+        except EOFError:
+            break
+
+        if import_error:
+            conn.send((False, import_error))
+            continue
+
+        try:
+            if fn_name == "run_simulation_batch" and not hasattr(solver, fn_name):
+                # Simulators generated before the batch contract — one run per params dict
+                param_grid, y0, t_span = args
+                result = [solver.run_simulation(p, y0, t_span) for p in param_grid]
+            else:
+                result = getattr(solver, fn_name)(*args)
+            conn.send((True, result))
+        except Exception as e:
+            conn.send((False, f"{type(e).__name__}: {e}"))
@@ -12,11 +12,12 @@ setup(
         "pydantic>=2.0",
         "scipy>=1.12.0",
         "numpy>=1.26.0",
+        "numba>=0.59.0",
         "streamlit>=1.35.0",
-        "plotly>=5.20.0",
+        "plotly>=6.0.0",
         "requests>=2.31.0",
     ],
     extras_require={
-        "dev": ["pytest>=8.0.0"],
+        "dev": ["pytest>=8.0.0", "pytest-xdist>=3.5", "pytest-socket>=0.7"],
     },
 )
@@ -0,0 +1,41 @@
+"""Shared fixtures."""
+
+from unittest.mock import patch
+
+import pytest
+
+from episim.core.model_spec import EpidemicModel
+
+
+@pytest.fixture(scope="session")
+def _sir_model_spec() -> EpidemicModel:
+    return EpidemicModel(
+        name="SIR",
+        paper_title="Test SIR",
+        compartments=["S", "I", "R"],
+        parameters={
+            "beta": {"value": 0.3, "description": "Transmission rate", "unit": "1/day", "slider_min": 0.03, "slider_max": 3.0},
+            "gamma": {"value": 0.1, "description": "Recovery rate", "unit": "1/day", "slider_min": 0.01, "slider_max": 1.0},
+        },
+        initial_conditions={"S": 999, "I": 1, "R": 0},
+        ode_system="def derivatives(t, y, params): pass",
+        simulation_days=160,
+        population=1000.0,
+        expected_results=[{"metric": "R0", "value": 3.0, "source": "Computed", "tolerance": 0.05}],
+    )
+
+
+@pytest.fixture
+def sir_model(_sir_model_spec) -> EpidemicModel:
+    """Placeholder SIR spec for agent/orchestrator tests — validated once, copied per test."""
+    return _sir_model_spec.model_copy(deep=True)
+
+
+@pytest.fixture
+def offline_side_agents():
+    """Fail the best-effort Summarizer and Coder fast — run_pipeline logs and skips them."""
+    offline = RuntimeError("agent not under test")
+    with patch("episim.core.orchestrator.summarize_paper", side_effect=offline), \
+            patch("episim.core.orchestrator.generate_standalone", side_effect=offline):
+        yield
+
@@ -0,0 +1,13 @@
+COMPARTMENTS = ["S", "E", "I", "R"]
+
+def derivatives(t, y, params):
+    S, E, I, R = y
+    N = S + E + I + R
+    beta = params['beta']
+    sigma = params['sigma']
+    gamma = params['gamma']
+    dSdt = -beta * S * I / N
+    dEdt = beta * S * I / N - sigma * E
+    dIdt = sigma * E - gamma * I
+    dRdt = gamma * I
+    return [dSdt, dEdt, dIdt, dRdt]
@@ -0,0 +1,11 @@
+COMPARTMENTS = ["S", "I", "R"]
+
+def derivatives(t, y, params):
+    S, I, R = y
+    N = S + I + R
+    beta = params['beta']
+    gamma = params['gamma']
+    dSdt = -beta * S * I / N
+    dIdt = beta * S * I / N - gamma * I
+    dRdt = gamma * I
+    return [dSdt, dIdt, dRdt]
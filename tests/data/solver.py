@@ -0,0 +1,13 @@
+from scipy.integrate import solve_ivp
+import numpy as np
+from model import COMPARTMENTS, derivatives
+
+def run_simulation(params, y0, t_span, num_points=200):
+    t_eval = np.linspace(t_span[0], t_span[1], num_points)
+    sol = solve_ivp(lambda t, y: derivatives(t, y, params),
+                    t_span, y0, method='LSODA', t_eval=t_eval,
+                    rtol=1e-6, atol=1e-6)
+    results = {'t': sol.t}
+    for i, name in enumerate(COMPARTMENTS):
+        results[name] = sol.y[i]
+    return results
@@ -0,0 +1,25 @@
+"""Shared test helpers — the hand-written simulators under tests/data."""
+
+import importlib
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache
+def load_asset(name: str) -> str:
+    """Text of a hand-written simulator file under tests/data."""
+    return (Path(__file__).parent / "data" / name).read_text()
+
+
+def load_solver(output_dir: Path):
+    """Import the generated solver in-process; model/solver are evicted so each dir loads fresh."""
+    for mod in ("model", "solver"):
+        sys.modules.pop(mod, None)
+    sys.path.insert(0, str(output_dir))
+    try:
+        return importlib.import_module("solver").run_simulation
+    finally:
+        sys.path.remove(str(output_dir))
+        for mod in ("model", "solver"):
+            sys.modules.pop(mod, None)
@@ -52,10 +52,10 @@ def _setup_stream_mock(mock_client, response):
     return stream_ctx
 
 
-@patch("episim.agents.builder.anthropic.Anthropic")
-def test_generate_creates_all_files(mock_anthropic_cls, tmp_path):
+@patch("episim.agents.builder.get_client")
+def test_generate_creates_all_files(mock_get_client, tmp_path):
     mock_client = MagicMock()
-    mock_anthropic_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
     _setup_stream_mock(mock_client, _make_mock_response(_MOCK_FILES))
 
     output_dir = tmp_path / "test_output"
@@ -66,10 +66,10 @@ def test_generate_creates_all_files(mock_anthropic_cls, tmp_path):
         assert (output_dir / fname).exists()
 
 
-@patch("episim.agents.builder.anthropic.Anthropic")
-def test_generated_model_py_is_valid_python(mock_anthropic_cls, tmp_path):
+@patch("episim.agents.builder.get_client")
+def test_generated_model_py_is_valid_python(mock_get_client, tmp_path):
     mock_client = MagicMock()
-    mock_anthropic_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
     _setup_stream_mock(mock_client, _make_mock_response(_MOCK_FILES))
 
     output_dir = tmp_path / "test_output"
@@ -79,10 +79,10 @@ def test_generated_model_py_is_valid_python(mock_anthropic_cls, tmp_path):
     compile(code, "model.py", "exec")  # raises SyntaxError if invalid
 
 
-@patch("episim.agents.builder.anthropic.Anthropic")
-def test_generated_solver_py_is_valid_python(mock_anthropic_cls, tmp_path):
+@patch("episim.agents.builder.get_client")
+def test_generated_solver_py_is_valid_python(mock_get_client, tmp_path):
     mock_client = MagicMock()
-    mock_anthropic_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
     _setup_stream_mock(mock_client, _make_mock_response(_MOCK_FILES))
 
     output_dir = tmp_path / "test_output"
@@ -92,10 +92,10 @@ def test_generated_solver_py_is_valid_python(mock_anthropic_cls, tmp_path):
     compile(code, "solver.py", "exec")
 
 
-@patch("episim.agents.builder.anthropic.Anthropic")
-def test_generated_config_is_valid_json(mock_anthropic_cls, tmp_path):
+@patch("episim.agents.builder.get_client")
+def test_generated_config_is_valid_json(mock_get_client, tmp_path):
     mock_client = MagicMock()
-    mock_anthropic_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
     _setup_stream_mock(mock_client, _make_mock_response(_MOCK_FILES))
 
     output_dir = tmp_path / "test_output"
@@ -106,10 +106,10 @@ def test_generated_config_is_valid_json(mock_anthropic_cls, tmp_path):
     assert "compartments" in config
 
 
-@patch("episim.agents.builder.anthropic.Anthropic")
-def test_uses_correct_api_config(mock_anthropic_cls, tmp_path):
+@patch("episim.agents.builder.get_client")
+def test_uses_correct_api_config(mock_get_client, tmp_path):
     mock_client = MagicMock()
-    mock_anthropic_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
     _setup_stream_mock(mock_client, _make_mock_response(_MOCK_FILES))
 
     generate_simulator(_SIR_MODEL, tmp_path / "out")
@@ -121,6 +121,22 @@ def test_uses_correct_api_config(mock_anthropic_cls, tmp_path):
     assert "tool_choice" not in call_kwargs
 
 
+@patch("episim.agents.builder.get_client")
+def test_repeat_model_served_from_cache(mock_get_client, tmp_path):
+    mock_client = MagicMock()
+    mock_get_client.return_value = mock_client
+    _setup_stream_mock(mock_client, _make_mock_response(_MOCK_FILES))
+
+    output_dir = tmp_path / "test_output"
+    generate_simulator(_SIR_MODEL, output_dir)
+    (output_dir / "model.py").write_text("# patched by debugger")
+
+    generate_simulator(_SIR_MODEL, output_dir)
+
+    assert mock_client.messages.stream.call_count == 1
+    assert (output_dir / "model.py").read_text() == _MOCK_FILES.model_py
+
+
 def test_system_prompt_has_file_contracts():
     assert "model.py" in BUILDER_SYSTEM_PROMPT
     assert "solver.py" in BUILDER_SYSTEM_PROMPT
@@ -0,0 +1,71 @@
+"""Tests for the on-disk LLM response cache."""
+
+from unittest.mock import MagicMock
+
+from anthropic.types import Message, TextBlock, ToolUseBlock, Usage
+
+from episim.agents._cache import cache_key, cached_final_message
+
+
+def _message(*content) -> Message:
+    return Message(
+        id="msg_1",
+        type="message",
+        role="assistant",
+        model="claude-test",
+        content=list(content),
+        stop_reason="tool_use",
+        stop_sequence=None,
+        usage=Usage(input_tokens=10, output_tokens=5),
+    )
+
+
+def _client_returning(response: Message) -> MagicMock:
+    client = MagicMock()
+    stream_ctx = MagicMock()
+    stream_ctx.__enter__ = MagicMock(return_value=stream_ctx)
+    stream_ctx.__exit__ = MagicMock(return_value=False)
+    stream_ctx.get_final_message.return_value = response
+    client.messages.stream.return_value = stream_ctx
+    return client
+
+
+_TOOL_RESPONSE = _message(ToolUseBlock(id="tu_1", type="tool_use", name="submit", input={"x": 1}))
+_KWARGS = dict(model="claude-test", max_tokens=10, messages=[{"role": "user", "content": "hi"}])
+
+
+def test_key_ignores_kwarg_order():
+    assert cache_key({"a": 1, "b": [1, 2]}) == cache_key({"b": [1, 2], "a": 1})
+    assert cache_key({"a": 1}) != cache_key({"a": 2})
+
+
+def test_disabled_without_env(monkeypatch):
+    monkeypatch.delenv("EPISIM_LLM_CACHE_DIR", raising=False)
+    client = _client_returning(_TOOL_RESPONSE)
+
+    cached_final_message(client, **_KWARGS)
+    cached_final_message(client, **_KWARGS)
+
+    assert client.messages.stream.call_count == 2
+
+
+def test_repeat_request_served_from_disk(monkeypatch, tmp_path):
+    monkeypatch.setenv("EPISIM_LLM_CACHE_DIR", str(tmp_path))
+    client = _client_returning(_TOOL_RESPONSE)
+
+    first = cached_final_message(client, **_KWARGS)
+    second = cached_final_message(client, **_KWARGS)
+
+    client.messages.stream.assert_called_once()
+    assert second.content[0].input == first.content[0].input == {"x": 1}
+
+
+def test_response_without_tool_call_not_stored(monkeypatch, tmp_path):
+    monkeypatch.setenv("EPISIM_LLM_CACHE_DIR", str(tmp_path))
+    client = _client_returning(_message(TextBlock(type="text", text="no tool")))
+
+    cached_final_message(client, **_KWARGS)
+    cached_final_message(client, **_KWARGS)
+
+    assert client.messages.stream.call_count == 2
+    assert not list(tmp_path.iterdir())
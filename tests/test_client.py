@@ -0,0 +1,16 @@
+"""Tests for the shared Anthropic client."""
+
+from unittest.mock import patch
+
+from episim.agents import _client
+
+
+@patch("episim.agents._client.anthropic.Anthropic")
+def test_client_created_once(mock_anthropic_cls, monkeypatch):
+    monkeypatch.setattr(_client, "_client", None)
+
+    first = _client.get_client()
+    second = _client.get_client()
+
+    assert first is second
+    mock_anthropic_cls.assert_called_once()
@@ -3,24 +3,7 @@
 from unittest.mock import MagicMock, patch
 
 from episim.agents.coder import generate_standalone, CODER_SYSTEM_PROMPT
-from episim.core.model_spec import EpidemicModel, StandaloneScript
-
-
-def _sir_model():
-    return EpidemicModel(
-        name="SIR",
-        paper_title="Test SIR Paper",
-        compartments=["S", "I", "R"],
-        parameters={
-            "beta": {"value": 0.3, "description": "Transmission rate", "unit": "1/day", "slider_min": 0.03, "slider_max": 3.0},
-            "gamma": {"value": 0.1, "description": "Recovery rate", "unit": "1/day", "slider_min": 0.01, "slider_max": 1.0},
-        },
-        initial_conditions={"S": 999, "I": 1, "R": 0},
-        ode_system="def derivatives(t, y, params): pass",
-        simulation_days=160,
-        population=1000.0,
-        expected_results=[],
-    )
+from episim.core.model_spec import StandaloneScript
 
 
 def _mock_script_data():
@@ -31,10 +14,10 @@ def _mock_script_data():
     }
 
 
-@patch("episim.agents.coder.anthropic.Anthropic")
-def test_generate_returns_valid_script(mock_anthropic_cls):
+@patch("episim.agents.coder.get_client")
+def test_generate_returns_valid_script(mock_get_client, sir_model):
     mock_client = MagicMock()
-    mock_anthropic_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     mock_tool_block = MagicMock()
     mock_tool_block.type = "tool_use"
@@ -50,7 +33,7 @@ def test_generate_returns_valid_script(mock_anthropic_cls):
     mock_stream.get_final_message.return_value = mock_response
     mock_client.messages.stream.return_value = mock_stream
 
-    result = generate_standalone(_sir_model(), "paper text here")
+    result = generate_standalone(sir_model, "paper text here")
 
     assert isinstance(result, StandaloneScript)
     assert result.filename == "sir_simulation.py"
@@ -70,10 +53,10 @@ def test_standalone_script_schema():
     assert "description" in schema["properties"]
 
 
-@patch("episim.agents.coder.anthropic.Anthropic")
-def test_paper_text_truncated_to_8000(mock_anthropic_cls):
+@patch("episim.agents.coder.get_client")
+def test_paper_text_truncated_to_8000(mock_get_client, sir_model):
     mock_client = MagicMock()
-    mock_anthropic_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     mock_tool_block = MagicMock()
     mock_tool_block.type = "tool_use"
@@ -90,7 +73,7 @@ def test_paper_text_truncated_to_8000(mock_anthropic_cls):
     mock_client.messages.stream.return_value = mock_stream
 
     long_text = "x" * 20000
-    generate_standalone(_sir_model(), long_text)
+    generate_standalone(sir_model, long_text)
 
     # Verify the user message sent to the API contains truncated paper text
     call_kwargs = mock_client.messages.stream.call_args[1]
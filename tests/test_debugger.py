@@ -1,27 +1,11 @@
 """Tests for debugger agent — analyze failures and patch code."""
 
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from episim.agents.debugger import debug_and_fix, apply_fixes, DEBUGGER_SYSTEM_PROMPT, MODEL
-from episim.core.model_spec import EpidemicModel, MetricResult, ValidationReport
-
-
-def _sir_model():
-    return EpidemicModel(
-        name="SIR",
-        paper_title="Test SIR",
-        compartments=["S", "I", "R"],
-        parameters={
-            "beta": {"value": 0.3, "description": "Transmission rate", "unit": "1/day", "slider_min": 0.03, "slider_max": 3.0},
-            "gamma": {"value": 0.1, "description": "Recovery rate", "unit": "1/day", "slider_min": 0.01, "slider_max": 1.0},
-        },
-        initial_conditions={"S": 999, "I": 1, "R": 0},
-        ode_system="def derivatives(t, y, params): pass",
-        simulation_days=160,
-        population=1000.0,
-        expected_results=[{"metric": "R0", "value": 3.0, "source": "Computed", "tolerance": 0.05}],
-    )
+from episim.agents.debugger import debug_and_fix, apply_fixes, speculative_fix, DEBUGGER_SYSTEM_PROMPT, MODEL, _FIX_HINTS
+from episim.core.model_spec import MetricResult, ValidationReport
 
 
 def _failed_report():
@@ -55,8 +39,8 @@ def _setup_stream_mock(mock_client, response):
     return stream_ctx
 
 
-@patch("episim.agents.debugger.anthropic.Anthropic")
-def test_debug_returns_fixes(mock_cls, tmp_path):
+@patch("episim.agents.debugger.get_client")
+def test_debug_returns_fixes(mock_cls, tmp_path, sir_model):
     mock_client = MagicMock()
     mock_cls.return_value = mock_client
 
@@ -68,12 +52,12 @@ def test_debug_returns_fixes(mock_cls, tmp_path):
     expected_fixes = {"model.py": "# fixed model"}
     _setup_stream_mock(mock_client, _make_mock_response(expected_fixes))
 
-    fixes = debug_and_fix(_failed_report(), tmp_path, _sir_model())
+    fixes = debug_and_fix(_failed_report(), tmp_path, sir_model)
     assert fixes == expected_fixes
 
 
-@patch("episim.agents.debugger.anthropic.Anthropic")
-def test_debug_uses_correct_api_config(mock_cls, tmp_path):
+@patch("episim.agents.debugger.get_client")
+def test_debug_uses_correct_api_config(mock_cls, tmp_path, sir_model):
     mock_client = MagicMock()
     mock_cls.return_value = mock_client
 
@@ -82,7 +66,7 @@ def test_debug_uses_correct_api_config(mock_cls, tmp_path):
 
     _setup_stream_mock(mock_client, _make_mock_response({}))
 
-    debug_and_fix(_failed_report(), tmp_path, _sir_model())
+    debug_and_fix(_failed_report(), tmp_path, sir_model)
 
     kwargs = mock_client.messages.stream.call_args.kwargs
     assert kwargs["model"] == MODEL
@@ -92,6 +76,18 @@ def test_debug_uses_correct_api_config(mock_cls, tmp_path):
     assert "tool_choice" not in kwargs
 
 
+@patch("episim.agents.debugger.get_client")
+def test_debug_hint_in_user_message(mock_cls, tmp_path, sir_model):
+    mock_client = MagicMock()
+    mock_cls.return_value = mock_client
+    _setup_stream_mock(mock_client, _make_mock_response({}))
+
+    debug_and_fix(_failed_report(), tmp_path, sir_model, hint="Check the signs.")
+
+    content = mock_client.messages.stream.call_args.kwargs["messages"][0]["content"]
+    assert content.endswith("## Suggested Approach\nCheck the signs.")
+
+
 class TestApplyFixes:
     def test_writes_fixed_files(self, tmp_path):
         (tmp_path / "model.py").write_text("old content")
@@ -108,3 +104,64 @@ class TestApplyFixes:
 def test_system_prompt_content():
     assert "debugger" in DEBUGGER_SYSTEM_PROMPT.lower() or "debug" in DEBUGGER_SYSTEM_PROMPT.lower()
     assert "ODE" in DEBUGGER_SYSTEM_PROMPT
+
+
+class TestSpeculativeFix:
+    @patch("episim.agents.debugger.validate")
+    @patch("episim.agents.debugger.debug_and_fix")
+    def test_picks_candidate_that_passes(self, mock_debug, mock_validate, tmp_path, sir_model):
+        (tmp_path / "model.py").write_text("original")
+        mock_debug.side_effect = [{"model.py": "bad"}, {"model.py": "good"}]
+
+        def _validate(stage, model):
+            passed = (Path(stage) / "model.py").read_text() == "good"
+            report = _failed_report()
+            report.all_passed = passed
+            return report
+
+        mock_validate.side_effect = _validate
+
+        fixes = speculative_fix(_failed_report(), tmp_path, sir_model, candidates=2)
+
+        assert fixes == {"model.py": "good"}
+        assert mock_debug.call_count == 2
+        # Candidates are staged elsewhere — output_dir is untouched
+        assert (tmp_path / "model.py").read_text() == "original"
+
+    @patch("episim.agents.debugger.validate", return_value=_failed_report())
+    @patch("episim.agents.debugger.debug_and_fix")
+    def test_failed_candidate_skipped(self, mock_debug, mock_validate, tmp_path, sir_model):
+        mock_debug.side_effect = [RuntimeError("API down"), {"model.py": "fix"}]
+
+        assert speculative_fix(_failed_report(), tmp_path, sir_model) == {"model.py": "fix"}
+
+    @patch("episim.agents.debugger.validate", return_value=_failed_report())
+    @patch("episim.agents.debugger.debug_and_fix", return_value={})
+    def test_candidates_get_distinct_hints(self, mock_debug, mock_validate, tmp_path, sir_model):
+        speculative_fix(_failed_report(), tmp_path, sir_model, candidates=2)
+
+        hints = {c.kwargs["hint"] for c in mock_debug.call_args_list}
+        assert len(hints) == 2
+
+    @patch("episim.agents.debugger.validate")
+    @patch("episim.agents.debugger.debug_and_fix")
+    def test_returns_without_waiting_for_slow_candidates(self, mock_debug, mock_validate, tmp_path, sir_model):
+        release = threading.Event()
+
+        def _debug(report, output_dir, model, hint):
+            if hint == _FIX_HINTS[0]:
+                return {"model.py": "good"}
+            release.wait(5)
+            return {"model.py": "slow"}
+
+        def _validate(stage, model):
+            report = _failed_report()
+            report.all_passed = True
+            return report
+
+        mock_debug.side_effect = _debug
+        mock_validate.side_effect = _validate
+        try:
+            assert speculative_fix(_failed_report(), tmp_path, sir_model, candidates=2) == {"model.py": "good"}
+        finally:
+            release.set()
@@ -0,0 +1,36 @@
+"""Tests for LTTB downsampling of plotted curves."""
+
+import numpy as np
+
+from episim.core.downsample import lttb
+
+
+def _epidemic_curve(n: int):
+    t = np.linspace(0, 300, n)
+    return t, 3000 * np.exp(-((t - 50) / 15) ** 2)
+
+
+class TestLTTB:
+    def test_large_series_downsampled_to_n_out(self):
+        x, y = _epidemic_curve(100_000)
+        xs, ys = lttb(x, y, 500)
+        assert len(xs) == len(ys) == 500
+        assert np.all(np.diff(xs) > 0)
+
+    def test_endpoints_kept(self):
+        x, y = _epidemic_curve(100_000)
+        xs, ys = lttb(x, y, 500)
+        assert (xs[0], ys[0]) == (x[0], y[0])
+        assert (xs[-1], ys[-1]) == (x[-1], y[-1])
+
+    def test_peaks_preserved(self):
+        x, y = _epidemic_curve(100_000)
+        y[70_000] = 5000.0  # a single-sample spike, far narrower than one bucket
+        xs, ys = lttb(x, y, 500)
+        assert 5000.0 in ys
+        assert np.isclose(ys[xs < 200].max(), 3000, rtol=1e-3)
+
+    def test_short_series_returned_unchanged(self):
+        x, y = _epidemic_curve(200)
+        xs, ys = lttb(x, y, 500)
+        assert xs is x and ys is y
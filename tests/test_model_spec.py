@@ -80,3 +80,8 @@ def test_parameter_defaults():
 def test_expected_result_default_tolerance():
     er = ExpectedResult(metric="R0", value=3.0, source="Table 1")
     assert er.tolerance == 0.05
+
+
+def test_jacobian_system_optional():
+    model = EpidemicModel.model_validate(SIR_SPEC)
+    assert model.jacobian_system is None
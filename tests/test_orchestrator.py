@@ -6,24 +6,9 @@ from unittest.mock import MagicMock, patch, call
 import pytest
 
 from episim.core.orchestrator import run_pipeline, _slugify, save_thinking
-from episim.core.model_spec import EpidemicModel, MetricResult, ValidationReport
+from episim.core.model_spec import MetricResult, ValidationReport
 
-
-def _sir_model():
-    return EpidemicModel(
-        name="SIR",
-        paper_title="Test SIR",
-        compartments=["S", "I", "R"],
-        parameters={
-            "beta": {"value": 0.3, "description": "Transmission rate", "unit": "1/day", "slider_min": 0.03, "slider_max": 3.0},
-            "gamma": {"value": 0.1, "description": "Recovery rate", "unit": "1/day", "slider_min": 0.01, "slider_max": 1.0},
-        },
-        initial_conditions={"S": 999, "I": 1, "R": 0},
-        ode_system="def derivatives(t, y, params): pass",
-        simulation_days=160,
-        population=1000.0,
-        expected_results=[{"metric": "R0", "value": 3.0, "source": "Computed", "tolerance": 0.05}],
-    )
+pytestmark = pytest.mark.usefixtures("offline_side_agents")
 
 
 def _passing_report():
@@ -76,8 +61,8 @@ class TestSaveThinking:
 @patch("episim.core.orchestrator.write_report")
 class TestRunPipeline:
     def test_happy_path(self, mock_write, mock_validate, mock_gen, mock_extract,
-                        mock_context, mock_load, tmp_path):
-        mock_extract.return_value = (_sir_model(), "thinking text")
+                        mock_context, mock_load, tmp_path, sir_model):
+        mock_extract.return_value = (sir_model, "thinking text")
         mock_validate.return_value = _passing_report()
 
         result = run_pipeline("test.pdf", str(tmp_path))
@@ -90,12 +75,12 @@ class TestRunPipeline:
         mock_validate.assert_called_once()
         mock_write.assert_called_once()
 
-    @patch("episim.core.orchestrator.debug_and_fix", return_value={"model.py": "fixed"})
+    @patch("episim.core.orchestrator.speculative_fix", return_value={"model.py": "fixed"})
     @patch("episim.core.orchestrator.apply_fixes")
     def test_debug_loop_on_failure(self, mock_apply, mock_debug,
                                     mock_write, mock_validate, mock_gen,
-                                    mock_extract, mock_context, mock_load, tmp_path):
-        mock_extract.return_value = (_sir_model(), "thinking")
+                                    mock_extract, mock_context, mock_load, tmp_path, sir_model):
+        mock_extract.return_value = (sir_model, "thinking")
         # First validation fails, second passes
         mock_validate.side_effect = [_failing_report(), _passing_report()]
 
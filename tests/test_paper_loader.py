@@ -7,7 +7,9 @@ from unittest.mock import MagicMock, patch
 import fitz
 import pytest
 
-from episim.core.paper_loader import load_paper, _extract_pdf, _strip_headers_footers
+from episim.core.paper_loader import (
+    load_paper, load_papers, _extract_pdf, _load_arxiv, _strip_headers_footers, extract_sections, paper_excerpt,
+)
 
 
 def _create_test_pdf(path: Path, pages: list[str]) -> None:
@@ -67,6 +69,38 @@ class TestStripHeadersFooters:
         assert result == full_text
 
 
+_SECTIONED_PAPER = (
+    "An SIR Study\n"
+    "Abstract\nWe fit an SIR model.\n"
+    "1. Introduction\nEpidemics spread.\n"
+    "2. Methods\nLots of algebra.\n"
+    "3 Results\nPeak at day 38.\n"
+    "Conclusions\nVaccinate early.\n"
+    "References\n[1] Kermack 1927.\n"
+)
+
+
+class TestSections:
+    def test_splits_on_headings(self):
+        sections = extract_sections(_SECTIONED_PAPER)
+        assert sections["abstract"] == "We fit an SIR model."
+        assert sections["methods"] == "Lots of algebra."
+        assert sections["results"] == "Peak at day 38."
+        assert sections["conclusion"] == "Vaccinate early."
+
+    def test_excerpt_keeps_key_sections_only(self):
+        excerpt = paper_excerpt(_SECTIONED_PAPER)
+        assert "Peak at day 38." in excerpt
+        assert "Lots of algebra" not in excerpt
+        assert "Kermack" not in excerpt
+
+    def test_excerpt_cuts_on_sentence_boundary(self):
+        text = "No headings here. " * 1000
+        excerpt = paper_excerpt(text, limit=500)
+        assert len(excerpt) <= 500
+        assert excerpt.endswith("here.")
+
+
 class TestLoadPaper:
     def test_local_pdf(self, tmp_path):
         pdf_path = tmp_path / "paper.pdf"
@@ -74,6 +108,22 @@ class TestLoadPaper:
         text = load_paper(str(pdf_path))
         assert "SIR model" in text
 
+    def test_edited_pdf_is_reloaded(self, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        _create_test_pdf(pdf_path, ["First draft."])
+        assert "First draft" in load_paper(str(pdf_path))
+
+        _create_test_pdf(pdf_path, ["Second draft with more words."])
+        assert "Second draft" in load_paper(str(pdf_path))
+
+    def test_load_papers_keeps_source_order(self, tmp_path):
+        paths = []
+        for i in range(5):
+            paths.append(tmp_path / f"paper{i}.pdf")
+            _create_test_pdf(paths[-1], [f"Paper number {i}."])
+        texts = load_papers([str(p) for p in paths])
+        assert [f"number {i}" in t for i, t in enumerate(texts)] == [True] * 5
+
     def test_invalid_path_raises(self):
         with pytest.raises(FileNotFoundError):
             load_paper("/nonexistent/path.pdf")
@@ -95,3 +145,50 @@ class TestLoadPaper:
         with patch("episim.core.paper_loader._load_arxiv", return_value="mock text") as mock:
             result = load_paper("https://arxiv.org/pdf/2401.12345")
             mock.assert_called_once_with("2401.12345")
+
+
+def _mock_arxiv_response(body: bytes) -> MagicMock:
+    resp = MagicMock()
+    resp.__enter__.return_value = resp
+    resp.iter_content.side_effect = lambda chunk_size: (
+        body[i:i + chunk_size] for i in range(0, len(body), chunk_size)
+    )
+    return resp
+
+
+class TestLoadArxiv:
+    @pytest.fixture(autouse=True)
+    def _isolated_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("episim.core.paper_loader._ARXIV_CACHE_DIR", tmp_path / "cache")
+        _load_arxiv.cache_clear()
+
+    def test_streams_pdf_to_text(self, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        _create_test_pdf(pdf_path, ["SEIR model from arxiv."])
+        resp = _mock_arxiv_response(pdf_path.read_bytes())
+
+        with patch("episim.core.paper_loader._SESSION.get", return_value=resp) as mock_get:
+            text = load_paper("2401.12345")
+
+        assert "SEIR model" in text
+        assert mock_get.call_args.kwargs["stream"] is True
+
+    def test_html_error_page_rejected(self):
+        resp = _mock_arxiv_response(b"<html>Rate limited</html>")
+        with patch("episim.core.paper_loader._SESSION.get", return_value=resp):
+            with pytest.raises(ValueError, match="did not return a PDF"):
+                load_paper("2401.12345")
+
+    def test_second_load_served_from_cache(self, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        _create_test_pdf(pdf_path, ["Cached SIR paper."])
+        resp = _mock_arxiv_response(pdf_path.read_bytes())
+
+        with patch("episim.core.paper_loader._SESSION.get", return_value=resp) as mock_get:
+            first = load_paper("2401.12345")
+            _load_arxiv.cache_clear()  # force the on-disk copy
+            second = load_paper("2401.12345")
+
+        mock_get.assert_called_once()
+        assert first == second
+        assert (tmp_path / "cache" / "2401.12345.pdf").is_file()
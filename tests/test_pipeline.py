@@ -1,110 +1,85 @@
 """Integration tests for the orchestrator pipeline."""
 
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-from episim.core.model_spec import EpidemicModel, MetricResult, ValidationReport, GeneratedFiles
+from episim.core.model_spec import MetricResult, ValidationReport, GeneratedFiles
 from episim.core.orchestrator import run_pipeline
 
+pytestmark = pytest.mark.usefixtures("offline_side_agents")
+
+
+# Built once; run_pipeline sets report.attempts, so tests hand out copies
+_PASSING_REPORT = ValidationReport(
+    paper_title="Test SIR",
+    model_name="SIR",
+    metrics=[MetricResult(metric="R0", expected=3.0, actual=3.0, match_pct=0.0, passed=True)],
+    all_passed=True,
+    attempts=1,
+)
+
+_FAILING_REPORT = ValidationReport(
+    paper_title="Test SIR",
+    model_name="SIR",
+    metrics=[MetricResult(metric="R0", expected=3.0, actual=1.0, match_pct=66.7, passed=False)],
+    all_passed=False,
+    attempts=1,
+)
+
 
-def _sir_model():
-    return EpidemicModel(
-        name="SIR",
-        paper_title="Test SIR",
-        compartments=["S", "I", "R"],
-        parameters={
-            "beta": {"value": 0.3, "description": "Transmission rate", "unit": "1/day", "slider_min": 0.03, "slider_max": 3.0},
-            "gamma": {"value": 0.1, "description": "Recovery rate", "unit": "1/day", "slider_min": 0.01, "slider_max": 1.0},
-        },
-        initial_conditions={"S": 999, "I": 1, "R": 0},
-        ode_system="def derivatives(t, y, params): pass",
-        simulation_days=160,
-        population=1000.0,
-        expected_results=[{"metric": "R0", "value": 3.0, "source": "Computed", "tolerance": 0.05}],
-    )
-
-
-def _passing_report():
-    return ValidationReport(
-        paper_title="Test SIR",
-        model_name="SIR",
-        metrics=[MetricResult(metric="R0", expected=3.0, actual=3.0, match_pct=0.0, passed=True)],
-        all_passed=True,
-        attempts=1,
-    )
-
-
-def _failing_report():
-    return ValidationReport(
-        paper_title="Test SIR",
-        model_name="SIR",
-        metrics=[MetricResult(metric="R0", expected=3.0, actual=1.0, match_pct=66.7, passed=False)],
-        all_passed=False,
-        attempts=1,
-    )
-
-
-@patch("episim.core.orchestrator.load_paper", return_value="paper text")
-@patch("episim.core.orchestrator.build_context", return_value="context")
-@patch("episim.core.orchestrator.extract_model")
-@patch("episim.core.orchestrator.generate_simulator")
-@patch("episim.core.orchestrator.validate")
-@patch("episim.core.orchestrator.write_report")
 class TestPipelineIntegration:
-    def test_output_dir_created(self, mock_wr, mock_val, mock_gen, mock_ext,
-                                 mock_ctx, mock_load, tmp_path):
-        mock_ext.return_value = (_sir_model(), "thinking")
-        mock_val.return_value = _passing_report()
+    @pytest.fixture(autouse=True)
+    def pipeline_mocks(self, sir_model):
+        """Patch every agent call run_pipeline makes, on one ExitStack."""
+        with ExitStack() as stack:
+            def mock(name, **kwargs):
+                return stack.enter_context(patch(f"episim.core.orchestrator.{name}", **kwargs))
+
+            mock("load_paper", return_value="paper text")
+            mock("build_context", return_value="context")
+            self.ext = mock("extract_model", return_value=(sir_model, "thinking"))
+            mock("generate_simulator")
+            self.val = mock("validate")
+            self.wr = mock("write_report")
+            self.debug = mock("speculative_fix", return_value={"model.py": "fixed"})
+            mock("apply_fixes")
+            yield
+
+    def test_output_dir_created(self, tmp_path):
+        self.val.return_value = _PASSING_REPORT.model_copy()
 
         result = run_pipeline("test.pdf", str(tmp_path))
         assert Path(result).exists()
 
-    def test_thinking_file_saved(self, mock_wr, mock_val, mock_gen, mock_ext,
-                                  mock_ctx, mock_load, tmp_path):
-        mock_ext.return_value = (_sir_model(), "My deep analysis")
-        mock_val.return_value = _passing_report()
+    def test_thinking_file_saved(self, tmp_path, sir_model):
+        self.ext.return_value = (sir_model, "My deep analysis")
+        self.val.return_value = _PASSING_REPORT.model_copy()
 
         result = run_pipeline("test.pdf", str(tmp_path))
         thinking_file = Path(result) / "thinking.md"
         assert thinking_file.exists()
         assert "My deep analysis" in thinking_file.read_text()
 
-    def test_report_written_on_pass(self, mock_wr, mock_val, mock_gen, mock_ext,
-                                     mock_ctx, mock_load, tmp_path):
-        mock_ext.return_value = (_sir_model(), "thinking")
-        mock_val.return_value = _passing_report()
+    def test_report_written_on_pass(self, tmp_path):
+        self.val.return_value = _PASSING_REPORT.model_copy()
 
         run_pipeline("test.pdf", str(tmp_path))
-        mock_wr.assert_called_once()
+        self.wr.assert_called_once()
 
-    def test_report_written_on_fail(self, mock_wr, mock_val, mock_gen, mock_ext,
-                                     mock_ctx, mock_load, tmp_path):
-        mock_ext.return_value = (_sir_model(), "thinking")
+    def test_failure_path(self, tmp_path):
         # All 3 attempts fail
-        mock_val.return_value = _failing_report()
-
-        with patch("episim.core.orchestrator.debug_and_fix", return_value={}):
-            with patch("episim.core.orchestrator.apply_fixes"):
-                run_pipeline("test.pdf", str(tmp_path))
-
-        # Report still written even on failure
-        mock_wr.assert_called_once()
-
-    @patch("episim.core.orchestrator.debug_and_fix", return_value={"model.py": "fixed"})
-    @patch("episim.core.orchestrator.apply_fixes")
-    def test_max_retries_respected(self, mock_apply, mock_debug,
-                                    mock_wr, mock_val, mock_gen, mock_ext,
-                                    mock_ctx, mock_load, tmp_path):
-        mock_ext.return_value = (_sir_model(), "thinking")
-        mock_val.return_value = _failing_report()
+        self.val.return_value = _FAILING_REPORT.model_copy()
 
         run_pipeline("test.pdf", str(tmp_path))
 
-        assert mock_val.call_count == 3
+        assert self.val.call_count == 3
         # Debug called for attempts 1 and 2 (not after attempt 3)
-        assert mock_debug.call_count == 2
+        assert self.debug.call_count == 2
+        # Report still written even on failure
+        self.wr.assert_called_once()
 
 
 class TestEdgeCases:
@@ -129,14 +104,14 @@ class TestEdgeCases:
     @patch("episim.core.orchestrator.validate")
     @patch("episim.core.orchestrator.write_report")
     def test_subprocess_crash_in_validation(self, mock_wr, mock_val, mock_gen,
-                                             mock_ext, mock_ctx, mock_load, tmp_path):
-        mock_ext.return_value = (_sir_model(), "thinking")
+                                             mock_ext, mock_ctx, mock_load, tmp_path, sir_model):
+        mock_ext.return_value = (sir_model, "thinking")
         mock_val.return_value = ValidationReport(
             paper_title="Test", model_name="SIR", metrics=[],
             all_passed=False, attempts=1, error="subprocess crashed"
         )
 
-        with patch("episim.core.orchestrator.debug_and_fix", return_value={}):
+        with patch("episim.core.orchestrator.speculative_fix", return_value={}):
             with patch("episim.core.orchestrator.apply_fixes"):
                 result = run_pipeline("test.pdf", str(tmp_path))
 
@@ -1,7 +1,10 @@
 """Tests for reader agent — model extraction from paper context."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from episim.agents.reader import extract_model, READER_SYSTEM_PROMPT, MODEL
 from episim.core.model_spec import EpidemicModel
 
@@ -36,61 +39,62 @@ _SIR_TOOL_INPUT = {
 
 
 def _make_mock_response(tool_input: dict):
-    """Create a mock Anthropic API response with tool_use block."""
-    tool_block = MagicMock()
-    tool_block.type = "tool_use"
-    tool_block.name = "submit_model"
-    tool_block.input = tool_input
-
-    response = MagicMock()
-    response.content = [tool_block]
-    return response
+    """Create a stand-in Anthropic API response with a tool_use block."""
+    tool_block = SimpleNamespace(type="tool_use", name="submit_model", input=tool_input)
+    return SimpleNamespace(content=[tool_block])
 
 
 def _make_thinking_events():
-    """Create mock stream events that include thinking deltas."""
-    events = []
+    """Create stream events that include thinking deltas."""
+    thinking = "This paper describes a classic SIR model with beta=0.3 and gamma=0.1."
+    return [
+        SimpleNamespace(type="content_block_start", content_block=SimpleNamespace(type="thinking")),
+        SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(type="thinking_delta", thinking=thinking)),
+        SimpleNamespace(type="content_block_stop"),
+    ]
+
+
+class _StreamCtx:
+    """Minimal stand-in for the context manager returned by messages.stream()."""
 
-    # Thinking block start
-    start_event = MagicMock()
-    start_event.type = "content_block_start"
-    start_event.content_block = MagicMock()
-    start_event.content_block.type = "thinking"
-    events.append(start_event)
+    def __init__(self, response, events=None):
+        self._response = response
+        self._events = events or []
 
-    # Thinking delta
-    delta_event = MagicMock()
-    delta_event.type = "content_block_delta"
-    delta_event.delta = MagicMock()
-    delta_event.delta.type = "thinking_delta"
-    delta_event.delta.thinking = "This paper describes a classic SIR model with beta=0.3 and gamma=0.1."
-    events.append(delta_event)
+    def __enter__(self):
+        return self
 
-    # Thinking block stop
-    stop_event = MagicMock()
-    stop_event.type = "content_block_stop"
-    events.append(stop_event)
+    def __exit__(self, *exc):
+        return False
 
-    return events
+    def __iter__(self):
+        return iter(self._events)
+
+    def get_final_message(self):
+        return self._response
 
 
 def _setup_stream_mock(mock_client, response, events=None):
-    """Set up mock_client.messages.stream() as a context manager with iterable events."""
-    stream_ctx = MagicMock()
-    stream_ctx.__enter__ = MagicMock(return_value=stream_ctx)
-    stream_ctx.__exit__ = MagicMock(return_value=False)
-    stream_ctx.__iter__ = MagicMock(return_value=iter(events or []))
-    stream_ctx.get_final_message.return_value = response
+    """Make mock_client.messages.stream() return a stream yielding events, then response."""
+    stream_ctx = _StreamCtx(response, events)
     mock_client.messages.stream.return_value = stream_ctx
     return stream_ctx
 
 
-@patch("episim.agents.reader.anthropic.Anthropic")
-def test_extract_model_returns_valid_model(mock_anthropic_cls):
-    mock_client = MagicMock()
-    mock_anthropic_cls.return_value = mock_client
-    _setup_stream_mock(mock_client, _make_mock_response(_SIR_TOOL_INPUT))
+# extract_model only reads the response, so one instance serves every test
+_SIR_RESPONSE = _make_mock_response(_SIR_TOOL_INPUT)
+
 
+@pytest.fixture
+def reader_client(monkeypatch):
+    """Client whose stream returns the SIR tool call with no thinking events."""
+    client = MagicMock()
+    monkeypatch.setattr("episim.agents.reader.get_client", lambda: client)
+    _setup_stream_mock(client, _SIR_RESPONSE)
+    return client
+
+
+def test_extract_model_returns_valid_model(reader_client):
     model, thinking = extract_model("fake paper context")
 
     assert isinstance(model, EpidemicModel)
@@ -100,33 +104,25 @@ def test_extract_model_returns_valid_model(mock_anthropic_cls):
     assert model.population == 1000.0
 
 
-@patch("episim.agents.reader.anthropic.Anthropic")
-def test_extract_model_captures_thinking(mock_anthropic_cls):
-    mock_client = MagicMock()
-    mock_anthropic_cls.return_value = mock_client
-    events = _make_thinking_events()
-    _setup_stream_mock(mock_client, _make_mock_response(_SIR_TOOL_INPUT), events)
+def test_extract_model_captures_thinking(reader_client):
+    _setup_stream_mock(reader_client, _SIR_RESPONSE, _make_thinking_events())
 
     model, thinking = extract_model("fake context")
 
     assert "SIR model" in thinking
 
 
-@patch("episim.agents.reader.anthropic.Anthropic")
-def test_extract_model_retries_on_failure(mock_anthropic_cls):
+@patch("episim.agents.reader.get_client")
+def test_extract_model_retries_on_failure(mock_get_client):
     mock_client = MagicMock()
-    mock_anthropic_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     # First call raises, second call succeeds
     fail_ctx = MagicMock()
     fail_ctx.__enter__ = MagicMock(side_effect=Exception("API error"))
     fail_ctx.__exit__ = MagicMock(return_value=False)
 
-    ok_ctx = MagicMock()
-    ok_ctx.__enter__ = MagicMock(return_value=ok_ctx)
-    ok_ctx.__exit__ = MagicMock(return_value=False)
-    ok_ctx.__iter__ = MagicMock(return_value=iter([]))
-    ok_ctx.get_final_message.return_value = _make_mock_response(_SIR_TOOL_INPUT)
+    ok_ctx = _StreamCtx(_SIR_RESPONSE)
 
     mock_client.messages.stream.side_effect = [fail_ctx, ok_ctx]
 
@@ -135,30 +131,23 @@ def test_extract_model_retries_on_failure(mock_anthropic_cls):
     assert mock_client.messages.stream.call_count == 2
 
 
-@patch("episim.agents.reader.anthropic.Anthropic")
-def test_extract_model_uses_correct_api_config(mock_anthropic_cls):
-    mock_client = MagicMock()
-    mock_anthropic_cls.return_value = mock_client
-    _setup_stream_mock(mock_client, _make_mock_response(_SIR_TOOL_INPUT))
-
+def test_extract_model_uses_correct_api_config(reader_client):
     extract_model("context")
 
-    call_kwargs = mock_client.messages.stream.call_args.kwargs
+    call_kwargs = reader_client.messages.stream.call_args.kwargs
     assert call_kwargs["model"] == MODEL
     assert "tool_choice" not in call_kwargs
+    assert call_kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert call_kwargs["messages"][0]["content"][0]["cache_control"] == {"type": "ephemeral"}
     # Adaptive thinking only enabled for Opus 4.6
     if "opus-4-6" in MODEL:
         assert call_kwargs["thinking"] == {"type": "adaptive"}
         assert call_kwargs["output_config"] == {"effort": "max"}
 
 
-@patch("episim.agents.reader.anthropic.Anthropic")
-def test_on_thinking_callback_receives_chunks(mock_anthropic_cls):
+def test_on_thinking_callback_receives_chunks(reader_client):
     """Verify that the on_thinking callback is called with thinking chunks."""
-    mock_client = MagicMock()
-    mock_anthropic_cls.return_value = mock_client
-    events = _make_thinking_events()
-    _setup_stream_mock(mock_client, _make_mock_response(_SIR_TOOL_INPUT), events)
+    _setup_stream_mock(reader_client, _SIR_RESPONSE, _make_thinking_events())
 
     chunks = []
     model, thinking = extract_model("context", on_thinking=chunks.append)
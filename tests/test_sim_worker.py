@@ -0,0 +1,73 @@
+"""Tests for the persistent simulation worker."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from episim.core.sim_worker import SimulationWorker
+from tests.helpers import load_asset
+
+
+def _write_sir_simulator(output_dir: Path) -> None:
+    (output_dir / "model.py").write_text(load_asset("sir_model.py"))
+    (output_dir / "solver.py").write_text(load_asset("solver.py"))
+
+
+@pytest.fixture
+def worker(tmp_path):
+    _write_sir_simulator(tmp_path)
+    w = SimulationWorker(tmp_path)
+    yield w
+    w.close()
+
+
+class TestSimulationWorker:
+    def test_returns_ndarrays(self, worker):
+        r = worker.run_simulation({"beta": 0.3, "gamma": 0.1}, [999, 1, 0], (0, 160))
+        assert set(r) == {"t", "S", "I", "R"}
+        assert r["I"].shape == (200,)
+        assert r["I"].max() > 100
+
+    def test_batch_falls_back_to_single_runs(self, worker):
+        grid = [{"beta": b, "gamma": 0.1} for b in (0.2, 0.3, 0.4)]
+        runs = worker.run_simulation_batch(grid, [999, 1, 0], (0, 160))
+        peaks = [r["I"].max() for r in runs]
+        assert len(runs) == 3
+        assert peaks == sorted(peaks)
+
+    def test_solver_error_keeps_worker_alive(self, worker):
+        with pytest.raises(RuntimeError, match="KeyError: 'gamma'"):
+            worker.run_simulation({"beta": 0.3}, [999, 1, 0], (0, 160))
+        assert worker.alive
+        r = worker.run_simulation({"beta": 0.3, "gamma": 0.1}, [999, 1, 0], (0, 160))
+        assert "S" in r
+
+    def test_broken_solver_reports_import_error(self, tmp_path):
+        (tmp_path / "solver.py").write_text("raise Exception('broken')")
+        w = SimulationWorker(tmp_path)
+        try:
+            with pytest.raises(RuntimeError, match="Could not import solver.py"):
+                w.run_simulation({}, [1.0], (0, 1))
+        finally:
+            w.close()
+
+    def test_concurrent_callers_get_their_own_results(self, worker):
+        betas = [0.15 + 0.01 * i for i in range(40)]
+
+        def _peak(beta):
+            return worker.run_simulation({"beta": beta, "gamma": 0.1}, [999, 1, 0], (0, 160))["I"].max()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            peaks = list(executor.map(_peak, betas))
+
+        # Higher beta → higher peak; a crossed reply would break the ordering
+        assert peaks == sorted(peaks)
+        assert len(set(peaks)) == len(betas)
+        assert worker.alive
+
+    def test_close_stops_process(self, worker):
+        worker.close()
+        assert not worker.alive
+        with pytest.raises(RuntimeError, match="not running"):
+            worker.run_simulation({"beta": 0.3, "gamma": 0.1}, [999, 1, 0], (0, 160))
@@ -11,6 +11,7 @@ import pytest
 
 from episim.core.model_spec import EpidemicModel
 from episim.agents.validator import validate
+from tests.helpers import load_asset, load_solver
 
 
 def _sir_model() -> EpidemicModel:
@@ -43,99 +44,50 @@ def _sir_model() -> EpidemicModel:
 
 def _write_sir_simulator(output_dir: Path) -> None:
     """Write a correct SIR simulator."""
-    (output_dir / "model.py").write_text(
-        'COMPARTMENTS = ["S", "I", "R"]\n\n'
-        "def derivatives(t, y, params):\n"
-        "    S, I, R = y\n"
-        "    N = sum(y)\n"
-        "    beta = params['beta']\n"
-        "    gamma = params['gamma']\n"
-        "    dSdt = -beta * S * I / N\n"
-        "    dIdt = beta * S * I / N - gamma * I\n"
-        "    dRdt = gamma * I\n"
-        "    return [dSdt, dIdt, dRdt]\n"
-    )
-    (output_dir / "solver.py").write_text(
-        "from scipy.integrate import solve_ivp\n"
-        "import numpy as np\n"
-        "from model import COMPARTMENTS, derivatives\n\n"
-        "def run_simulation(params, y0, t_span, num_points=1000):\n"
-        "    t_eval = np.linspace(t_span[0], t_span[1], num_points)\n"
-        "    sol = solve_ivp(lambda t, y: derivatives(t, y, params),\n"
-        "                    t_span, y0, method='RK45', t_eval=t_eval,\n"
-        "                    max_step=1.0, rtol=1e-8, atol=1e-8)\n"
-        "    results = {'t': sol.t}\n"
-        "    for i, name in enumerate(COMPARTMENTS):\n"
-        "        results[name] = sol.y[i]\n"
-        "    return results\n"
-    )
+    (output_dir / "model.py").write_text(load_asset("sir_model.py"))
+    (output_dir / "solver.py").write_text(load_asset("solver.py"))
+
+
+@pytest.fixture(scope="module")
+def sir_sim_results(tmp_path_factory):
+    """Run the simulator once and return its derived scalars."""
+    d = tmp_path_factory.mktemp("sir")
+    _write_sir_simulator(d)
+    run = load_solver(d)
+    r = run({'beta': 0.3, 'gamma': 0.1}, [9999, 1, 0], (0, 300))
+    total = r["S"] + r["I"] + r["R"]
+    return {"max_dev": float(np.max(np.abs(total - 10000))), "peak": float(np.max(r["I"])), "final": float(r["I"][-1])}
+
+
+@pytest.fixture(scope="module")
+def sir_report(tmp_path_factory):
+    """One validator run shared by every report assertion."""
+    d = tmp_path_factory.mktemp("sir_report")
+    _write_sir_simulator(d)
+    return validate(d, _sir_model())
 
 
 class TestSIRBasic:
-    def test_r0_validation_passes(self, tmp_path):
-        _write_sir_simulator(tmp_path)
-        model = _sir_model()
-        report = validate(tmp_path, model)
-        r0_result = next(m for m in report.metrics if m.metric == "R0")
-        assert r0_result.passed
-        assert abs(r0_result.actual - 3.0) < 0.01
-
-    def test_attack_rate_validation(self, tmp_path):
-        _write_sir_simulator(tmp_path)
-        model = _sir_model()
-        report = validate(tmp_path, model)
-        ar_result = next(m for m in report.metrics if m.metric == "attack_rate")
+    @pytest.mark.parametrize("metric,lo,hi", [
+        ("R0", 2.99, 3.01),
         # SIR with R0=3 has attack rate ~0.94 (from final size equation)
-        assert ar_result.passed
-        assert 0.90 < ar_result.actual < 0.98
+        ("attack_rate", 0.90, 0.98),
+    ])
+    def test_metric_validation(self, sir_report, metric, lo, hi):
+        result = next(m for m in sir_report.metrics if m.metric == metric)
+        assert result.passed
+        assert lo < result.actual < hi
 
-    def test_all_metrics_pass(self, tmp_path):
-        _write_sir_simulator(tmp_path)
-        model = _sir_model()
-        report = validate(tmp_path, model)
-        assert report.all_passed
+    def test_all_metrics_pass(self, sir_report):
+        assert sir_report.all_passed
 
-    def test_population_conserved(self, tmp_path):
+    def test_population_conserved(self, sir_sim_results):
         """Verify S + I + R = N at all time points."""
-        _write_sir_simulator(tmp_path)
-        # Run simulation directly
-        import sys
-        sys.path.insert(0, str(tmp_path))
-        try:
-            from importlib import import_module
-            # Use subprocess to avoid import caching issues
-            import subprocess
-            result = subprocess.run(
-                [sys.executable, "-c",
-                 "import sys; sys.path.insert(0, '.')\n"
-                 "from solver import run_simulation\n"
-                 "r = run_simulation({'beta': 0.3, 'gamma': 0.1}, [9999, 1, 0], (0, 300))\n"
-                 "import numpy as np\n"
-                 "total = r['S'] + r['I'] + r['R']\n"
-                 "print(f'{np.max(np.abs(total - 10000))}')\n"],
-                cwd=str(tmp_path), capture_output=True, text=True, timeout=30
-            )
-            max_deviation = float(result.stdout.strip())
-            assert max_deviation < 1e-4, f"Population not conserved: max deviation {max_deviation}"
-        finally:
-            sys.path.pop(0)
-
-    def test_epidemic_peaks_then_declines(self, tmp_path):
+        max_deviation = sir_sim_results["max_dev"]
+        assert max_deviation < 1e-4, f"Population not conserved: max deviation {max_deviation}"
+
+    def test_epidemic_peaks_then_declines(self, sir_sim_results):
         """Verify I rises, peaks, then falls to near zero."""
-        _write_sir_simulator(tmp_path)
-        import subprocess, sys
-        result = subprocess.run(
-            [sys.executable, "-c",
-             "import sys; sys.path.insert(0, '.')\n"
-             "from solver import run_simulation\n"
-             "import numpy as np\n"
-             "r = run_simulation({'beta': 0.3, 'gamma': 0.1}, [9999, 1, 0], (0, 300))\n"
-             "I = r['I']\n"
-             "peak = np.max(I)\n"
-             "final = I[-1]\n"
-             "print(f'{peak},{final}')\n"],
-            cwd=str(tmp_path), capture_output=True, text=True, timeout=30
-        )
-        peak, final = [float(x) for x in result.stdout.strip().split(",")]
+        peak, final = sir_sim_results["peak"], sir_sim_results["final"]
         assert peak > 1000, f"Peak too low: {peak}"
         assert final < 1, f"Final infected too high: {final}"
@@ -2,41 +2,24 @@
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from episim.core.model_spec import EpidemicModel
-from episim.agents.validator import validate, write_report, _generate_validate_script
+from episim.core.model_spec import EpidemicModel, ExpectedResult
+from episim.agents.validator import validate, write_report, _compare_metric, _generate_validate_script, _run_script
+from tests.helpers import load_asset
 
 
 def _create_sir_simulator(output_dir: Path) -> None:
     """Write a known-good SIR simulator into output_dir."""
-    (output_dir / "model.py").write_text(
-        'COMPARTMENTS = ["S", "I", "R"]\n\n'
-        "def derivatives(t, y, params):\n"
-        "    S, I, R = y\n"
-        "    N = sum(y)\n"
-        "    beta = params['beta']\n"
-        "    gamma = params['gamma']\n"
-        "    return [-beta*S*I/N, beta*S*I/N - gamma*I, gamma*I]\n"
-    )
-    (output_dir / "solver.py").write_text(
-        "from scipy.integrate import solve_ivp\n"
-        "import numpy as np\n"
-        "from model import COMPARTMENTS, derivatives\n\n"
-        "def run_simulation(params, y0, t_span, num_points=1000):\n"
-        "    t_eval = np.linspace(t_span[0], t_span[1], num_points)\n"
-        "    sol = solve_ivp(lambda t, y: derivatives(t, y, params),\n"
-        "                    t_span, y0, method='RK45', t_eval=t_eval,\n"
-        "                    max_step=1.0, rtol=1e-8, atol=1e-8)\n"
-        "    results = {'t': sol.t}\n"
-        "    for i, name in enumerate(COMPARTMENTS):\n"
-        "        results[name] = sol.y[i]\n"
-        "    return results\n"
-    )
+    (output_dir / "model.py").write_text(load_asset("sir_model.py"))
+    (output_dir / "solver.py").write_text(load_asset("solver.py"))
 
 
-def _sir_model() -> EpidemicModel:
+@pytest.fixture(scope="module")
+def sir_spec() -> EpidemicModel:
+    """Runnable SIR spec, built once — tests that change it take a deep copy."""
     return EpidemicModel(
         name="SIR",
         paper_title="Test SIR Paper",
@@ -46,8 +29,8 @@ def _sir_model() -> EpidemicModel:
             "gamma": {"value": 0.1, "description": "Recovery rate", "unit": "1/day", "slider_min": 0.01, "slider_max": 1.0},
         },
         initial_conditions={"S": 999, "I": 1, "R": 0},
-        ode_system="def derivatives(t, y, params):\n    S, I, R = y\n    N = sum(y)\n    return [-params['beta']*S*I/N, params['beta']*S*I/N - params['gamma']*I, params['gamma']*I]",
-        simulation_days=160,
+        ode_system="def derivatives(t, y, params):\n    S, I, R = y\n    N = S + I + R\n    return [-params['beta']*S*I/N, params['beta']*S*I/N - params['gamma']*I, params['gamma']*I]",
+        simulation_days=60,  # the epidemic peaks near day 38
         population=1000.0,
         expected_results=[
             {"metric": "R0", "value": 3.0, "source": "Computed", "tolerance": 0.05},
@@ -55,47 +38,97 @@ def _sir_model() -> EpidemicModel:
     )
 
 
-class TestValidate:
-    def test_known_good_sir_passes(self, tmp_path):
-        _create_sir_simulator(tmp_path)
-        model = _sir_model()
-        report = validate(tmp_path, model)
+@pytest.fixture(scope="module")
+def sir_sim_dir(tmp_path_factory) -> Path:
+    """Known-good simulator shared by tests that only vary the spec."""
+    d = tmp_path_factory.mktemp("sir_sim")
+    _create_sir_simulator(d)
+    return d
 
-        assert report.all_passed
-        assert len(report.metrics) == 1
-        assert report.metrics[0].metric == "R0"
-        assert report.metrics[0].passed
 
-    def test_wrong_expected_value_fails(self, tmp_path):
-        _create_sir_simulator(tmp_path)
-        model = _sir_model()
-        # Set wrong expected R0
-        model.expected_results[0].value = 10.0
+@pytest.fixture(scope="module")
+def sir_report(sir_sim_dir, sir_spec):
+    """One validator run over the known-good simulator."""
+    return validate(sir_sim_dir, sir_spec)
+
+
+@pytest.fixture(scope="module")
+def sir_script(sir_spec) -> str:
+    return _generate_validate_script(sir_spec)
 
-        report = validate(tmp_path, model)
-        assert not report.all_passed
-        assert not report.metrics[0].passed
 
-    def test_broken_code_returns_error(self, tmp_path):
+class TestValidate:
+    def test_known_good_sir_passes(self, sir_report):
+        assert sir_report.all_passed
+        assert len(sir_report.metrics) == 1
+        assert sir_report.metrics[0].metric == "R0"
+        assert sir_report.metrics[0].passed
+
+    def test_wrong_expected_value_fails(self, sir_report):
+        # Same simulated R0, compared against a wrong expected value
+        wrong = ExpectedResult(metric="R0", value=10.0, source="Computed", tolerance=0.05)
+        result = _compare_metric(wrong, sir_report.metrics[0].actual)
+        assert not result.passed
+        assert result.match_pct == 70.0
+
+    def test_broken_code_returns_error(self, tmp_path, sir_spec):
         (tmp_path / "model.py").write_text("raise Exception('broken')")
         (tmp_path / "solver.py").write_text("def run_simulation(*a, **kw): pass")
-        model = _sir_model()
-        report = validate(tmp_path, model)
+        report = validate(tmp_path, sir_spec)
 
         assert not report.all_passed
         assert report.error is not None
 
+    def test_syntax_error_reported_without_running(self, tmp_path, sir_spec):
+        (tmp_path / "model.py").write_text("def derivatives(t, y, params)\n    return y\n")
+        (tmp_path / "solver.py").write_text("pass")
+        with patch("episim.agents.validator._run_script") as mock_run:
+            report = validate(tmp_path, sir_spec)
+
+        mock_run.assert_not_called()
+        assert "SyntaxError" in report.error
+        assert "model.py" in report.error
+
+    def test_fixed_code_picked_up_on_next_attempt(self, tmp_path, sir_spec):
+        (tmp_path / "model.py").write_text("raise Exception('broken')")
+        (tmp_path / "solver.py").write_text("from model import COMPARTMENTS")
+        assert validate(tmp_path, sir_spec).error is not None
+
+        _create_sir_simulator(tmp_path)
+        assert validate(tmp_path, sir_spec).all_passed
+
+    @pytest.mark.parametrize("exit_arg, returncode", [("", 0), ("None", 0), ("3", 3), ("'bad params'", 1)])
+    def test_sys_exit_maps_like_the_interpreter(self, tmp_path, exit_arg, returncode):
+        (tmp_path / "_validate.py").write_text(f"import sys\nsys.exit({exit_arg})\n")
+        assert _run_script(tmp_path)[0] == returncode
+
+    def test_hanging_code_times_out(self, tmp_path, monkeypatch, sir_spec):
+        monkeypatch.setattr("episim.agents.validator._TIMEOUT", 1)
+        (tmp_path / "model.py").write_text("import time\ntime.sleep(60)")
+        report = validate(tmp_path, sir_spec)
+
+        assert not report.all_passed
+        assert "timed out" in report.error
+
 
 class TestGenerateScript:
-    def test_script_is_valid_python(self):
-        model = _sir_model()
-        script = _generate_validate_script(model)
-        compile(script, "_validate.py", "exec")
-
-    def test_script_contains_metric(self):
-        model = _sir_model()
-        script = _generate_validate_script(model)
-        assert "R0" in script
+    def test_script_is_valid_python(self, sir_script):
+        compile(sir_script, "_validate.py", "exec")
+
+    def test_script_contains_metric(self, sir_script):
+        assert "R0" in sir_script
+
+    def test_curve_metrics_share_one_argmax(self, sir_sim_dir, sir_spec):
+        model = sir_spec.model_copy(deep=True)
+        model.expected_results = [
+            ExpectedResult(metric="peak_day", value=38.3, source="Computed"),
+            ExpectedResult(metric="peak_cases", value=300.8, source="Computed"),
+        ]
+        assert _generate_validate_script(model).count("np.argmax") == 1
+
+        report = validate(sir_sim_dir, model)
+        assert report.all_passed
+        assert [m.metric for m in report.metrics] == ["peak_day", "peak_cases"]
 
 
 class TestWriteReport: